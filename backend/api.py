@@ -1,27 +1,64 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.responses import JSONResponse
-from websocket_manager import websocket_manager  # Keep for compatibility
 from websocket_handler import sign_handler  # Enhanced handler
-from services.inference import get_inference_service
+from services.inference import get_inference_service, get_inference_batcher
 from services.asl_dictionary import get_asl_recognizer
 from services.text2sign import text_to_signs
-try:
-    from services.advanced_recognition import AdvancedASLRecognizer
-    advanced_recognizer = AdvancedASLRecognizer()
-except ImportError:
-    advanced_recognizer = None
-    logger.warning("Advanced recognition not available")
+import aiofiles
+import asyncio
 import json
 import logging
+import math
 import os
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import numpy as np
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, NamedTuple, Tuple, Optional
 from datetime import datetime
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+# Setup logging (configured once by the entrypoint)
 logger = logging.getLogger(__name__)
 
+try:
+    from services.advanced_recognition import AdvancedASLRecognizer
+    advanced_recognizer = AdvancedASLRecognizer()
+except ImportError:
+    advanced_recognizer = None
+    logger.warning("Advanced recognition not available")
+
+# Resolve the recognizer/inference singletons once at import; main.py loads
+# the model into this same inference instance at startup
+inference_service = get_inference_service()
+inference_batcher = get_inference_batcher()
+asl_recognizer = get_asl_recognizer()
+
+# orjson (Rust JSON) parses/serializes landmark-shaped payloads 2-5x faster
+# than stdlib json; fall back silently when it is not installed
+try:
+    import orjson
+
+    def json_loads(data):
+        return orjson.loads(data)
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def json_dumps_bytes(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    orjson = None
+
+    def json_loads(data):
+        return json.loads(data)
+
+    def json_dumps(obj) -> str:
+        return json.dumps(obj)
+
+    def json_dumps_bytes(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
 # Create API router
 router = APIRouter()
 
@@ -29,112 +66,294 @@ router = APIRouter()
 TRAINING_DATA_DIR = "training_data"
 os.makedirs(TRAINING_DATA_DIR, exist_ok=True)
 
-def analyze_hand_gesture(landmarks: List[Dict[str, float]]) -> Dict[str, Any]:
+# MediaPipe hand model landmark indices, hoisted out of the per-frame path
+WRIST = 0
+THUMB_IP = 3
+THUMB_TIP = 4
+MIDDLE_MCP = 9
+FINGER_PIPS = np.array([6, 10, 14, 18])    # index, middle, ring, pinky
+FINGER_TIPS = np.array([8, 12, 16, 20])
+
+class HandFeatures(NamedTuple):
+    """Per-hand gesture features (tuple layout: no per-frame dict allocs)."""
+    valid: bool
+    mask: int = 0
+    fingers_up: int = 0
+    thumb_up: bool = False
+    thumb_down: bool = False
+    index_up: bool = False
+    middle_up: bool = False
+    ring_up: bool = False
+    pinky_up: bool = False
+    is_fist: bool = False
+    is_open: bool = False
+    is_pointing: bool = False
+    is_peace: bool = False
+    is_ok: bool = False
+    hand_height: float = 0.0
+    hand_center_x: float = 0.0
+    hand_center_y: float = 0.0
+    openness: float = 0.0
+
+# Shared sentinel for hands with too few landmarks
+_INVALID_HAND = HandFeatures(valid=False)
+
+def landmarks_to_array(landmarks: List[Dict[str, float]]) -> np.ndarray:
     """
-    Enhanced hand gesture analysis for better basic sign recognition.
-    
+    Convert one hand's landmark dicts to a (21, 3) float32 array.
+
     Args:
         landmarks: List of 21 hand landmarks with x, y, z coordinates
-        
+
     Returns:
-        Dictionary with gesture features
+        Array of shape (21, 3), or an empty array if too few landmarks
     """
     if len(landmarks) < 21:
-        return {"valid": False}
-    
-    # Key landmark indices (MediaPipe hand model)
-    WRIST = 0
-    THUMB_CMC = 1
-    THUMB_MCP = 2
-    THUMB_IP = 3
-    THUMB_TIP = 4
-    INDEX_MCP = 5
-    INDEX_PIP = 6
-    INDEX_DIP = 7
-    INDEX_TIP = 8
-    MIDDLE_MCP = 9
-    MIDDLE_PIP = 10
-    MIDDLE_DIP = 11
-    MIDDLE_TIP = 12
-    RING_MCP = 13
-    RING_PIP = 14
-    RING_DIP = 15
-    RING_TIP = 16
-    PINKY_MCP = 17
-    PINKY_PIP = 18
-    PINKY_DIP = 19
-    PINKY_TIP = 20
-    
-    # Extract key landmarks
-    wrist = landmarks[WRIST]
-    thumb_tip = landmarks[THUMB_TIP]
-    thumb_ip = landmarks[THUMB_IP]
-    index_tip = landmarks[INDEX_TIP]
-    index_pip = landmarks[INDEX_PIP]
-    index_mcp = landmarks[INDEX_MCP]
-    middle_tip = landmarks[MIDDLE_TIP]
-    middle_pip = landmarks[MIDDLE_PIP]
-    ring_tip = landmarks[RING_TIP]
-    ring_pip = landmarks[RING_PIP]
-    pinky_tip = landmarks[PINKY_TIP]
-    pinky_pip = landmarks[PINKY_PIP]
-    
-    # Enhanced finger detection with better thresholds
-    # Thumb detection (different orientation)
-    thumb_up = thumb_tip['y'] < thumb_ip['y'] - 0.02
-    thumb_down = thumb_tip['y'] > wrist['y'] + 0.05
-    
-    # Finger extension detection (more accurate)
-    index_extended = index_tip['y'] < index_pip['y'] - 0.02
-    middle_extended = middle_tip['y'] < middle_pip['y'] - 0.02
-    ring_extended = ring_tip['y'] < ring_pip['y'] - 0.02
-    pinky_extended = pinky_tip['y'] < pinky_pip['y'] - 0.02
-    
+        return np.empty((0, 3), dtype=np.float32)
+
+    return np.fromiter(
+        (c for lm in landmarks[:21] for c in (lm['x'], lm['y'], lm['z'])),
+        dtype=np.float32,
+        count=63
+    ).reshape(21, 3)
+
+def _gesture_scalars(arr):
+    """
+    Numeric core of analyze_hand_gesture, written with scalar indexing so
+    Numba can lower it to native code when available (see below).
+    """
+    thumb_up = arr[THUMB_TIP, 1] < arr[THUMB_IP, 1] - 0.02
+    thumb_down = arr[THUMB_TIP, 1] > arr[WRIST, 1] + 0.05
+    index_up = arr[8, 1] < arr[6, 1] - 0.02
+    middle_up = arr[12, 1] < arr[10, 1] - 0.02
+    ring_up = arr[16, 1] < arr[14, 1] - 0.02
+    pinky_up = arr[20, 1] < arr[18, 1] - 0.02
+
+    hand_center_x = arr[:, 0].mean()
+    hand_center_y = arr[:, 1].mean()
+
+    # Hand openness (distance between fingertips and palm); math.sqrt avoids
+    # the generic ** pow dispatch and compiles to a single sqrt under Numba
+    openness = 0.0
+    for tip in (8, 12, 16, 20):
+        dx = arr[tip, 0] - arr[MIDDLE_MCP, 0]
+        dy = arr[tip, 1] - arr[MIDDLE_MCP, 1]
+        openness += math.sqrt(dx * dx + dy * dy)
+    openness *= 0.25
+
+    return (thumb_up, thumb_down, index_up, middle_up, ring_up, pinky_up,
+            hand_center_x, hand_center_y, openness)
+
+def _two_hand_scalars(hands):
+    """
+    Relational features for the two-hand classifier, same scalar-indexed
+    style as _gesture_scalars so Numba can compile it (see below).
+    """
+    thumbs_up = (hands[0, THUMB_TIP, 1] < hands[0, THUMB_IP, 1] - 0.02 and
+                 hands[1, THUMB_TIP, 1] < hands[1, THUMB_IP, 1] - 0.02)
+    peace = (hands[0, 8, 1] < hands[0, 6, 1] - 0.02 and
+             hands[0, 12, 1] < hands[0, 10, 1] - 0.02 and
+             hands[1, 8, 1] < hands[1, 6, 1] - 0.02 and
+             hands[1, 12, 1] < hands[1, 10, 1] - 0.02)
+
+    x_gap = abs(hands[0, :, 0].mean() - hands[1, :, 0].mean())
+    height0 = hands[0, :, 1].mean()
+    height1 = hands[1, :, 1].mean()
+
+    return thumbs_up, peace, x_gap, height0, height1
+
+# JIT-compile the feature kernels when Numba is installed; warm them at import
+# so compilation cost is paid at startup, not on the first client frame
+try:
+    from numba import njit
+    _gesture_scalars = njit(cache=True, fastmath=True)(_gesture_scalars)
+    _gesture_scalars(np.zeros((21, 3), np.float32))
+    _two_hand_scalars = njit(cache=True, fastmath=True)(_two_hand_scalars)
+    _two_hand_scalars(np.zeros((2, 21, 3), np.float32))
+except ImportError:
+    pass
+
+def analyze_hand_gesture(arr: np.ndarray) -> HandFeatures:
+    """
+    Enhanced hand gesture analysis for better basic sign recognition.
+
+    Args:
+        arr: (21, 3) float32 array of hand landmarks (see landmarks_to_array)
+
+    Returns:
+        HandFeatures with the extracted gesture features
+    """
+    if arr.shape[0] < 21:
+        return _INVALID_HAND
+
+    (thumb_up, thumb_down, index_extended, middle_extended, ring_extended,
+     pinky_extended, hand_center_x, hand_center_y, openness) = _gesture_scalars(arr)
+
+    thumb_up = bool(thumb_up)
+    thumb_down = bool(thumb_down)
+    index_extended = bool(index_extended)
+    middle_extended = bool(middle_extended)
+    ring_extended = bool(ring_extended)
+    pinky_extended = bool(pinky_extended)
+    hand_center_x = float(hand_center_x)
+    hand_center_y = float(hand_center_y)
+    openness = float(openness)
+
     # Count extended fingers
-    fingers_up = sum([index_extended, middle_extended, ring_extended, pinky_extended])
-    
-    # Calculate hand center
-    hand_center_x = sum(l['x'] for l in landmarks) / len(landmarks)
-    hand_center_y = sum(l['y'] for l in landmarks) / len(landmarks)
-    
+    fingers_up = index_extended + middle_extended + ring_extended + pinky_extended
+
     # Hand height (0 = top, 1 = bottom)
     hand_height = hand_center_y
-    
-    # Hand openness (distance between fingertips and palm)
-    palm_center = landmarks[MIDDLE_MCP]
-    openness = sum([
-        ((index_tip['x'] - palm_center['x'])**2 + (index_tip['y'] - palm_center['y'])**2)**0.5,
-        ((middle_tip['x'] - palm_center['x'])**2 + (middle_tip['y'] - palm_center['y'])**2)**0.5,
-        ((ring_tip['x'] - palm_center['x'])**2 + (ring_tip['y'] - palm_center['y'])**2)**0.5,
-        ((pinky_tip['x'] - palm_center['x'])**2 + (pinky_tip['y'] - palm_center['y'])**2)**0.5
-    ]) / 4
-    
+
     # Detect specific hand shapes
     is_fist = fingers_up == 0 and not thumb_up
     is_open = fingers_up == 4 and openness > 0.15
     is_pointing = index_extended and fingers_up == 1
     is_peace = index_extended and middle_extended and fingers_up == 2
     is_ok = thumb_up and index_extended and middle_extended and fingers_up == 3
-    
-    return {
-        "valid": True,
-        "fingers_up": fingers_up,
-        "thumb_up": thumb_up,
-        "thumb_down": thumb_down,
-        "index_up": index_extended,
-        "middle_up": middle_extended,
-        "ring_up": ring_extended,
-        "pinky_up": pinky_extended,
-        "is_fist": is_fist,
-        "is_open": is_open,
-        "is_pointing": is_pointing,
-        "is_peace": is_peace,
-        "is_ok": is_ok,
-        "hand_height": hand_height,
-        "hand_center_x": hand_center_x,
-        "hand_center_y": hand_center_y,
-        "openness": openness
-    }
+
+    # Boolean shape bitmask indexing the precomputed one-hand decision table
+    mask = (
+        int(thumb_up)
+        | (int(index_extended) << 1)
+        | (int(middle_extended) << 2)
+        | (int(ring_extended) << 3)
+        | (int(pinky_extended) << 4)
+        | (int(openness > 0.15) << 5)
+    )
+
+    return HandFeatures(
+        valid=True,
+        mask=mask,
+        fingers_up=fingers_up,
+        thumb_up=thumb_up,
+        thumb_down=thumb_down,
+        index_up=index_extended,
+        middle_up=middle_extended,
+        ring_up=ring_extended,
+        pinky_up=pinky_extended,
+        is_fist=is_fist,
+        is_open=is_open,
+        is_pointing=is_pointing,
+        is_peace=is_peace,
+        is_ok=is_ok,
+        hand_height=hand_height,
+        hand_center_x=hand_center_x,
+        hand_center_y=hand_center_y,
+        openness=openness
+    )
+
+# --- One-hand decision table -------------------------------------------------
+# The boolean shape features fully determine which branch of the old if/elif
+# ladder fires; only the choice *within* a branch depends on hand position.
+# Enumerate all 64 shape masks once at import and dispatch with a single dict
+# lookup per frame. Entries are either a constant (word, confidence) tuple or
+# a resolver called with (hand_height, hand_center_x).
+
+def _resolve_open_hand(height: float, center_x: float) -> Tuple[str, float]:
+    """Open hand: wave (HELLO) up high, position-dependent signs below."""
+    if height < 0.5:
+        if 0.4 < center_x < 0.6:
+            return "HELLO", 0.92
+        return "HELLO", 0.75
+    if height > 0.7:
+        return "HELP", 0.80     # Open hand low
+    if height < 0.3:
+        return "PLEASE", 0.75   # Open hand high
+    if center_x < 0.3:
+        return "COME", 0.70     # Open hand to side
+    if center_x > 0.7:
+        return "GO", 0.70       # Open hand other side
+    return "WAIT", 0.65         # Open hand center
+
+def _resolve_thumbs_up(height: float, center_x: float) -> Tuple[str, float]:
+    """Thumbs up (GOOD/YES)."""
+    if height < 0.5:
+        return "GOOD", 0.95
+    return "YES", 0.90
+
+def _resolve_pointing(height: float, center_x: float) -> Tuple[str, float]:
+    """Pointing (YOU/ME/THAT)."""
+    if center_x > 0.6:
+        return "YOU", 0.88
+    if center_x < 0.4:
+        return "ME", 0.88
+    return "THAT", 0.85
+
+def _resolve_fist(height: float, center_x: float) -> Tuple[str, float]:
+    """Fist gestures (STOP/NO/SORRY)."""
+    if height < 0.4:
+        return "STOP", 0.85
+    if height > 0.7:
+        return "NO", 0.80
+    # Fist at chest could be different signs
+    if 0.45 < center_x < 0.55:
+        return "SORRY", 0.75    # Fist on chest
+    return "NO", 0.70
+
+def _resolve_unmatched(height: float, center_x: float) -> Tuple[str, float]:
+    """Default based on hand position."""
+    if height < 0.3:
+        return "UP", 0.60
+    if height > 0.7:
+        return "DOWN", 0.60
+    return "UNKNOWN", 0.45
+
+def _build_one_hand_table() -> Dict[int, Any]:
+    """Replay the one-hand rule cascade for every shape mask."""
+    table = {}
+    for mask in range(64):
+        thumb_up = bool(mask & 1)
+        index_up = bool(mask & 2)
+        middle_up = bool(mask & 4)
+        ring_up = bool(mask & 8)
+        pinky_up = bool(mask & 16)
+        open_enough = bool(mask & 32)   # openness > 0.15
+
+        fingers_up = sum([index_up, middle_up, ring_up, pinky_up])
+        is_fist = fingers_up == 0 and not thumb_up
+        is_open = fingers_up == 4 and open_enough
+        is_pointing = index_up and fingers_up == 1
+        is_peace = index_up and middle_up and fingers_up == 2
+        is_ok = thumb_up and index_up and middle_up and fingers_up == 3
+
+        if is_open:
+            entry = _resolve_open_hand
+        elif thumb_up and fingers_up == 0:
+            entry = _resolve_thumbs_up
+        elif is_pointing:
+            entry = _resolve_pointing
+        elif is_peace:
+            entry = ("PEACE", 0.90)
+        elif is_ok:
+            entry = ("OK", 0.87)
+        elif is_fist:
+            entry = _resolve_fist
+        elif fingers_up == 1:
+            # Number gestures - more accurate detection
+            if index_up:
+                entry = ("ONE", 0.95)
+            elif thumb_up:
+                entry = ("GOOD", 0.85)
+            else:
+                entry = ("ONE", 0.80)
+        elif fingers_up == 2:
+            # index+middle is PEACE (caught above), other pairs are TWO
+            entry = ("TWO", 0.85)
+        elif fingers_up == 3:
+            if index_up and middle_up and ring_up:
+                entry = ("THREE", 0.95)
+            else:
+                entry = ("THREE", 0.85)
+        elif fingers_up == 4:
+            entry = ("FOUR", 0.95) if not thumb_up else ("FOUR", 0.85)
+        else:
+            entry = _resolve_unmatched
+
+        table[mask] = entry
+    return table
+
+_ONE_HAND_TABLE = _build_one_hand_table()
 
 def process_sign_language(pose_data: List[List[Dict[str, float]]]) -> Tuple[str, float]:
     """
@@ -149,16 +368,75 @@ def process_sign_language(pose_data: List[List[Dict[str, float]]]) -> Tuple[str,
     if not pose_data or len(pose_data) == 0:
         return "Unknown", 0.0
     
-    num_hands = len(pose_data)
-    logger.debug(f"Processing {num_hands} hands for gesture recognition")
-    
+    return classify_hand_arrays([landmarks_to_array(hand) for hand in pose_data])
+
+# Identical-frame cache: consecutive 30 Hz frames are near-identical while a
+# pose is held, so quantize coordinates to int8 (1/127 buckets) and reuse the
+# last classification for hash-equal frames. FIFO-evicted, bounded size.
+_CLASSIFY_CACHE: "OrderedDict[bytes, Tuple[str, float]]" = OrderedDict()
+_CLASSIFY_CACHE_SIZE = 512
+
+def classify_hand_arrays(hand_arrays: List[np.ndarray]) -> Tuple[str, float]:
+    """
+    Rule-based gesture classification over (21, 3) landmark arrays.
+
+    Results are memoized on the quantized landmarks, which skips the whole
+    feature pipeline for the common held-pose case.
+
+    Args:
+        hand_arrays: One (21, 3) float32 array per detected hand
+
+    Returns:
+        Tuple of (predicted_word, confidence_score)
+    """
+    if not hand_arrays:
+        return "Unknown", 0.0
+
+    key = b"".join((arr * 127).astype(np.int8).tobytes() for arr in hand_arrays)
+    cached = _CLASSIFY_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    result = _classify_hand_arrays(hand_arrays)
+
+    _CLASSIFY_CACHE[key] = result
+    if len(_CLASSIFY_CACHE) > _CLASSIFY_CACHE_SIZE:
+        _CLASSIFY_CACHE.popitem(last=False)
+    return result
+
+def _classify_hand_arrays(hand_arrays: List[np.ndarray]) -> Tuple[str, float]:
+    """Uncached rule-based classification (see classify_hand_arrays)."""
+
+    num_hands = len(hand_arrays)
+    logger.debug("Processing %d hands for gesture recognition", num_hands)
+
+    # Cheapest check first: >2 hands has no classification rules, so bail
+    # before any per-hand analysis
+    if num_hands > 2:
+        return "Unknown", 0.45
+
+    if num_hands == 2:
+        # Two hand gestures: analyze both hands in one batched pass
+        first, second = hand_arrays
+        first_valid = first.shape[0] == 21
+        second_valid = second.shape[0] == 21
+        if not (first_valid or second_valid):
+            logger.debug("No valid hand features found")
+            return "Unknown", 0.0
+        # With one undetected hand, mirror the valid one (degraded mode)
+        if not first_valid:
+            first = second
+        elif not second_valid:
+            second = first
+        return _classify_two_hands(np.stack((first, second)))
+
     # Analyze each hand
     hand_features = []
-    for i, hand_landmarks in enumerate(pose_data):
-        features = analyze_hand_gesture(hand_landmarks)
-        if features["valid"]:
+    for i, arr in enumerate(hand_arrays):
+        features = analyze_hand_gesture(arr)
+        if features.valid:
             hand_features.append(features)
-            logger.debug(f"Hand {i+1} features: {features}")
+            logger.debug("Hand %d features: %s", i + 1, features)
     
     if not hand_features:
         logger.debug("No valid hand features found")
@@ -166,157 +444,57 @@ def process_sign_language(pose_data: List[List[Dict[str, float]]]) -> Tuple[str,
     
     # Enhanced gesture recognition for basic signs
     if num_hands == 1:
-        # Single hand gestures
+        # Single hand gestures: one table lookup on the shape mask, then an
+        # (optional) position resolver for the branches that depend on it
         hand = hand_features[0]
-        
-        # Wave detection (HELLO) - open hand at shoulder height
-        if hand["is_open"] and hand["hand_height"] < 0.5:
-            # Check if hand is moving (would need motion detection)
-            if hand["hand_center_x"] > 0.4 and hand["hand_center_x"] < 0.6:
-                return "HELLO", 0.92
-            else:
-                return "HELLO", 0.75
-        
-        # Thumbs up (GOOD/YES)
-        elif hand["thumb_up"] and hand["fingers_up"] == 0:
-            if hand["hand_height"] < 0.5:
-                return "GOOD", 0.95
-            else:
-                return "YES", 0.90
-        
-        # Pointing (YOU/THERE/THAT)
-        elif hand["is_pointing"]:
-            if hand["hand_center_x"] > 0.6:
-                return "YOU", 0.88
-            elif hand["hand_center_x"] < 0.4:
-                return "ME", 0.88
-            else:
-                return "THAT", 0.85
-        
-        # Peace sign
-        elif hand["is_peace"]:
-            return "PEACE", 0.90
-        
-        # OK sign (three fingers up, thumb and index making circle)
-        elif hand["is_ok"]:
-            return "OK", 0.87
-        
-        # Fist gestures
-        elif hand["is_fist"]:
-            if hand["hand_height"] < 0.4:
-                return "STOP", 0.85
-            elif hand["hand_height"] > 0.7:
-                return "NO", 0.80
-            else:
-                # Fist at chest could be different signs
-                if hand["hand_center_x"] > 0.45 and hand["hand_center_x"] < 0.55:
-                    return "SORRY", 0.75  # Fist on chest
-                else:
-                    return "NO", 0.70
-        
-        # Open hand gestures based on position
-        elif hand["is_open"]:
-            if hand["hand_height"] > 0.7:
-                return "HELP", 0.80  # Open hand low
-            elif hand["hand_height"] < 0.3:
-                return "PLEASE", 0.75  # Open hand high
-            elif hand["hand_center_x"] < 0.3:
-                return "COME", 0.70  # Open hand to side
-            elif hand["hand_center_x"] > 0.7:
-                return "GO", 0.70  # Open hand other side
-            else:
-                return "WAIT", 0.65  # Open hand center
-        
-        # Number gestures - more accurate detection
-        elif hand["fingers_up"] == 1:
-            if hand["index_up"]:
-                return "ONE", 0.95
-            elif hand["thumb_up"]:
-                return "GOOD", 0.85
-            else:
-                return "ONE", 0.80
-        elif hand["fingers_up"] == 2:
-            if hand["index_up"] and hand["middle_up"]:
-                return "TWO", 0.95
-            else:
-                return "TWO", 0.85
-        elif hand["fingers_up"] == 3:
-            if hand["index_up"] and hand["middle_up"] and hand["ring_up"]:
-                return "THREE", 0.95
-            else:
-                return "THREE", 0.85
-        elif hand["fingers_up"] == 4:
-            if not hand["thumb_up"]:
-                return "FOUR", 0.95
-            else:
-                return "FOUR", 0.85
-        elif hand["fingers_up"] == 5 or (hand["fingers_up"] == 4 and hand["thumb_up"]):
-            return "FIVE", 0.95
-        
-        # Special hand shapes
-        elif hand["thumb_up"] and hand["pinky_up"] and hand["fingers_up"] == 2:
-            return "I_LOVE_YOU", 0.90  # ILY sign
-        elif hand["index_up"] and not hand["middle_up"] and not hand["ring_up"] and not hand["pinky_up"]:
-            if hand["hand_height"] < 0.4:
-                return "WAIT", 0.80  # Index up = wait
-            else:
-                return "ONE", 0.85
-        
-        # Check for letters (finger spelling)
-        elif hand["fingers_up"] == 0 and hand["thumb_up"]:
-            return "LETTER_A", 0.75
-        elif hand["fingers_up"] == 4 and not hand["thumb_up"]:
-            return "LETTER_B", 0.75
-        
-        else:
-            # Default based on hand position
-            if hand["hand_height"] < 0.3:
-                return "UP", 0.60
-            elif hand["hand_height"] > 0.7:
-                return "DOWN", 0.60
-            else:
-                return "UNKNOWN", 0.45
-            
-    elif num_hands == 2:
-        # Two hand gestures - enhanced detection
-        left_hand = hand_features[0]
-        right_hand = hand_features[1] if len(hand_features) > 1 else hand_features[0]
-        
-        # Both hands raised high (celebration/greeting)
-        if left_hand["hand_height"] < 0.25 and right_hand["hand_height"] < 0.25:
-            return "HELLO", 0.95
-        
-        # Prayer/thank you gesture - hands close together at center
-        elif abs(left_hand["hand_center_x"] - right_hand["hand_center_x"]) < 0.12:
-            if left_hand["hand_height"] < 0.6 and right_hand["hand_height"] < 0.6:
-                return "THANK_YOU", 0.96
-            else:
-                return "PLEASE", 0.90
-        
-        # Both thumbs up - love/approval
-        elif left_hand["thumb_up"] and right_hand["thumb_up"]:
-            return "LOVE", 0.98
-        
-        # Both hands showing peace signs
-        elif (left_hand["index_up"] and left_hand["middle_up"] and 
-              right_hand["index_up"] and right_hand["middle_up"]):
-            return "PEACE", 0.94
-        
-        # Hands spread wide apart - big/good gesture
-        elif abs(left_hand["hand_center_x"] - right_hand["hand_center_x"]) > 0.5:
-            return "GOOD", 0.85
-        
-        # Clapping motion (hands close, medium height)
-        elif (abs(left_hand["hand_center_x"] - right_hand["hand_center_x"]) < 0.2 and
-              left_hand["hand_height"] > 0.3 and right_hand["hand_height"] > 0.3):
-            return "GOOD", 0.83
-        
-        else:
-            return "THANK_YOU", 0.60
+        entry = _ONE_HAND_TABLE[hand.mask]
+        if callable(entry):
+            return entry(hand.hand_height, hand.hand_center_x)
+        return entry
     
     # Default case
     return "Unknown", 0.45
 
+def _classify_two_hands(hands: np.ndarray) -> Tuple[str, float]:
+    """
+    Two-hand gesture detection over a stacked (2, 21, 3) landmark tensor.
+
+    The numeric features come out of the (optionally JIT-compiled)
+    _two_hand_scalars kernel in one pass; only the cheap decision ladder
+    stays in Python.
+    """
+    both_thumbs_up, both_peace, x_gap, height0, height1 = _two_hand_scalars(hands)
+
+    # Both hands raised high (celebration/greeting)
+    if height0 < 0.25 and height1 < 0.25:
+        return "HELLO", 0.95
+
+    # Prayer/thank you gesture - hands close together at center
+    elif x_gap < 0.12:
+        if height0 < 0.6 and height1 < 0.6:
+            return "THANK_YOU", 0.96
+        else:
+            return "PLEASE", 0.90
+
+    # Both thumbs up - love/approval
+    elif both_thumbs_up:
+        return "LOVE", 0.98
+
+    # Both hands showing peace signs
+    elif both_peace:
+        return "PEACE", 0.94
+
+    # Hands spread wide apart - big/good gesture
+    elif x_gap > 0.5:
+        return "GOOD", 0.85
+
+    # Clapping motion (hands close, medium height)
+    elif x_gap < 0.2 and height0 > 0.3 and height1 > 0.3:
+        return "GOOD", 0.83
+
+    else:
+        return "THANK_YOU", 0.60
+
 @router.post("/training/upload")
 async def upload_training_data(data: Dict[str, Any]):
     """
@@ -339,21 +517,27 @@ async def upload_training_data(data: Dict[str, Any]):
         if not gesture or not frames:
             raise HTTPException(status_code=400, detail="Missing gesture or frames data")
         
+        # Reject malformed payloads before paying for serialization
+        if not isinstance(frames, list):
+            raise HTTPException(status_code=400, detail="frames must be a list")
+        
         # Create gesture directory
         gesture_dir = os.path.join(TRAINING_DATA_DIR, gesture)
         os.makedirs(gesture_dir, exist_ok=True)
         
-        # Save training data
+        # Save training data: encode off-loop (long recordings are CPU-heavy
+        # to serialize) and write without blocking WebSocket traffic
         filename = f"{gesture}_{int(timestamp)}.json"
         filepath = os.path.join(gesture_dir, filename)
         
-        with open(filepath, 'w') as f:
-            json.dump({
-                "gesture": gesture,
-                "frames": frames,
-                "duration": duration,
-                "timestamp": timestamp
-            }, f)
+        payload = await asyncio.to_thread(json_dumps_bytes, {
+            "gesture": gesture,
+            "frames": frames,
+            "duration": duration,
+            "timestamp": timestamp
+        })
+        async with aiofiles.open(filepath, 'wb') as f:
+            await f.write(payload)
         
         logger.info(f"Saved training data for {gesture}: {filename}")
         
@@ -367,65 +551,421 @@ async def upload_training_data(data: Dict[str, Any]):
         logger.error(f"Error uploading training data: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# Brief cache for /training/stats so dashboard polling doesn't rewalk the
+# data directory on every request
+_STATS_CACHE_TTL = 5.0
+_stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
 @router.get("/training/stats")
 async def get_training_stats():
     """
     Get statistics about collected training data
     """
+    global _stats_cache
     try:
+        now = time.monotonic()
+        if _stats_cache is not None and now - _stats_cache[0] < _STATS_CACHE_TTL:
+            return JSONResponse(_stats_cache[1])
+        
         stats = {}
         total_samples = 0
         
+        # One scandir pass per directory: counts entries without building
+        # (and stat-ing) intermediate file-name lists. Samples are .npz from
+        # the collector or legacy .json, same as the train_model loader.
         if os.path.exists(TRAINING_DATA_DIR):
-            for gesture_name in os.listdir(TRAINING_DATA_DIR):
-                gesture_path = os.path.join(TRAINING_DATA_DIR, gesture_name)
-                if os.path.isdir(gesture_path):
-                    samples = len([f for f in os.listdir(gesture_path) if f.endswith('.json')])
-                    stats[gesture_name] = samples
+            with os.scandir(TRAINING_DATA_DIR) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    with os.scandir(entry.path) as files:
+                        samples = sum(
+                            1 for f in files
+                            if f.is_file(follow_symlinks=False)
+                            and f.name.endswith(('.json', '.npz'))
+                        )
+                    stats[entry.name] = samples
                     total_samples += samples
         
-        return JSONResponse({
+        payload = {
             "status": "success",
             "total_samples": total_samples,
             "gestures": stats,
             "data_directory": TRAINING_DATA_DIR
-        })
+        }
+        _stats_cache = (now, payload)
+        return JSONResponse(payload)
         
     except Exception as e:
         logger.error(f"Error getting training stats: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# Training runs in a single-worker process pool: TF holds the GIL and burns
+# CPU for minutes, which would stall realtime inference inside this process
+_train_executor: Optional[ProcessPoolExecutor] = None
+_train_future = None
+
 @router.post("/train/model")
 async def trigger_model_training():
     """
     Trigger model training with collected data
     """
+    global _train_executor, _train_future
     try:
         # Import training module
         from train_model import train_sign_language_model
         
-        # Run training in background (in production, use Celery or similar)
-        import threading
-        training_thread = threading.Thread(
-            target=train_sign_language_model,
-            kwargs={
-                "data_dir": TRAINING_DATA_DIR,
-                "model_save_path": "models/sign_language_model.h5",
-                "epochs": 50,
-                "batch_size": 32
-            }
+        if _train_future is not None and not _train_future.done():
+            return JSONResponse({
+                "status": "busy",
+                "message": "Model training already in progress"
+            })
+        
+        if _train_executor is None:
+            # spawn, not fork: this process has TensorFlow initialized and
+            # forking it can deadlock the child's thread pools
+            _train_executor = ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context("spawn")
+            )
+        
+        _train_future = _train_executor.submit(
+            train_sign_language_model,
+            data_dir=TRAINING_DATA_DIR,
+            model_save_path="models/sign_language_model.h5",
+            epochs=50,
+            batch_size=32
         )
-        training_thread.start()
         
         return JSONResponse({
             "status": "success",
-            "message": "Model training started in background"
+            "message": "Model training started in background process"
         })
         
     except Exception as e:
         logger.error(f"Error starting model training: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# Maximum number of queued frames drained into a single batched response
+MAX_WS_BATCH = 8
+
+# Re-send an unchanged prediction after this many suppressed repeats (~1 s at
+# 30 Hz) so clients can still detect a held sign / stale stream
+PREDICTION_REFRESH_FRAMES = 30
+
+# Response template cache: the classifiers emit a small fixed set of
+# (word, confidence) pairs, so each response shape is serialized exactly once.
+# Bounded defensively since ML confidences are float-valued.
+_PREDICTIONS: Dict[Tuple[str, str, float], Tuple[Dict[str, Any], str]] = {}
+_PREDICTIONS_MAX = 4096
+
+def prediction_response(word: str, confidence: float, key: str = "sign") -> Tuple[Dict[str, Any], str]:
+    """
+    Return (response_dict, serialized_payload) for a prediction, cached per
+    (key, word, confidence) so the hot path skips JSON encoding entirely.
+    """
+    cache_key = (key, word, confidence)
+    entry = _PREDICTIONS.get(cache_key)
+    if entry is None:
+        response = {"type": "prediction", key: word, "confidence": confidence}
+        entry = (response, json_dumps(response))
+        if len(_PREDICTIONS) < _PREDICTIONS_MAX:
+            _PREDICTIONS[cache_key] = entry
+    return entry
+
+# Pre-encoded frames for the fixed error responses
+_ERROR_MALFORMED_BINARY = json_dumps({
+    "status": "error",
+    "message": "Malformed binary landmark frame"
+})
+_ERROR_UNKNOWN_FORMAT = json_dumps({
+    "type": "error",
+    "message": "Unknown data format"
+})
+
+def decode_binary_landmarks(buf: bytes) -> Optional[np.ndarray]:
+    """
+    Decode a binary landmark frame into a (num_hands, 21, 3) float32 array.
+
+    Wire format: 4-byte little-endian header whose first byte is the hand
+    count, followed by num_hands * 21 * 3 float32 coordinates (~252 bytes
+    for two hands vs ~2 KB of JSON dicts). Parsed zero-copy via np.frombuffer.
+
+    Returns:
+        Landmark array, or None if the frame is truncated or empty
+    """
+    if len(buf) < 4:
+        return None
+
+    num_hands = buf[0]
+    if num_hands == 0 or len(buf) < 4 + num_hands * 63 * 4:
+        return None
+
+    return np.frombuffer(
+        buf, dtype=np.float32, offset=4, count=num_hands * 63
+    ).reshape(num_hands, 21, 3)
+
+async def receive_frame(websocket: WebSocket):
+    """Receive one WebSocket frame as text (JSON) or bytes (binary landmarks)."""
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000))
+    if message.get("bytes") is not None:
+        return message["bytes"]
+    return message.get("text", "")
+
+# Sentinel queued by the reader task when the peer disconnects
+_DISCONNECT = object()
+
+async def frame_reader(websocket: WebSocket, queue: asyncio.Queue):
+    """
+    Per-connection reader task: pushes incoming frames into a bounded queue
+    so receiving the next frame overlaps processing of the current one.
+    When the queue is full the oldest frame is dropped - stale pose frames
+    are worthless for realtime translation.
+    """
+    try:
+        while True:
+            frame = await receive_frame(websocket)
+            if queue.full():
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+            queue.put_nowait(frame)
+    except WebSocketDisconnect:
+        # Make room if needed - the sentinel must always land
+        if queue.full():
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        queue.put_nowait(_DISCONNECT)
+
+async def handle_sign_message(websocket: WebSocket, data,
+                              scratch: Optional[np.ndarray] = None) -> Optional[Tuple[Dict[str, Any], str]]:
+    """
+    Process one WebSocket message and return its prediction, if any, as a
+    cached (response_dict, serialized_payload) pair from prediction_response.
+
+    Auxiliary frames (speech results, gesture metadata, errors) are sent
+    immediately; only prediction responses are returned so the caller can
+    batch them into a single frame. scratch is the connection's reusable
+    (2, 21, 3) landmark buffer for binary frames.
+    """
+    try:
+        # Binary landmark fast path: first byte 0x7B ('{') means JSON text
+        if isinstance(data, (bytes, bytearray)) and not data.startswith(b"{"):
+            hands = decode_binary_landmarks(bytes(data))
+            if hands is None:
+                await websocket.send_text(_ERROR_MALFORMED_BINARY)
+                return None
+
+            # Copy into the connection's preallocated scratch buffer: keeps
+            # the kernel input aligned and avoids a fresh array per frame
+            num_hands = hands.shape[0]
+            if scratch is not None and num_hands <= scratch.shape[0]:
+                np.copyto(scratch[:num_hands], hands)
+                hands = scratch[:num_hands]
+
+            predicted_word, confidence = classify_hand_arrays(list(hands))
+            if confidence > 0.4 or (predicted_word != "UNKNOWN" and confidence > 0.3):
+                return prediction_response(predicted_word, confidence)
+            return None
+
+        # Parse the JSON data
+        json_data = json_loads(data)
+
+        # Check data type
+        if json_data.get("type") == "landmarks" or json_data.get("type") == "holistic":
+            # Handle both simple landmarks and holistic data
+            if json_data.get("type") == "holistic":
+                # Extract hand landmarks from holistic data
+                holistic_data = json_data.get("data", {})
+                pose_data = []
+
+                if holistic_data.get("leftHandLandmarks"):
+                    pose_data.append(holistic_data["leftHandLandmarks"])
+                if holistic_data.get("rightHandLandmarks"):
+                    pose_data.append(holistic_data["rightHandLandmarks"])
+
+                # Also extract pose and face for advanced recognition
+                pose_landmarks = holistic_data.get("poseLandmarks")
+                face_landmarks = holistic_data.get("faceLandmarks")
+            else:
+                # Simple landmarks format
+                pose_data = json_data.get("data", [])
+                pose_landmarks = None
+                face_landmarks = None
+
+            if not pose_data or len(pose_data) == 0:
+                logger.warning("Received empty pose data")
+                return None
+
+            # Early reject: no hand carries a full 21-landmark set (common
+            # during MediaPipe warmup) - skip the whole recognition cascade
+            # before any per-landmark work happens
+            if not any(hand and len(hand) >= 21 for hand in pose_data):
+                logger.debug("Rejected frame without a complete landmark set")
+                return None
+
+            # Per-frame message: DEBUG only, lazy %-formatting so a disabled
+            # logger pays neither the string build nor the lock
+            logger.debug("Received pose data: %d hands", len(pose_data))
+
+            # Temporal-coherence prefilter: hands stationary since the last
+            # frame reproduce the last answer, so skip the whole recognizer
+            # cascade and reuse it (L1 threshold ~2% mean movement per coord)
+            flat = np.concatenate([landmarks_to_array(hand).ravel() for hand in pose_data])
+            last_flat = getattr(websocket, '_last_flat', None)
+            if (last_flat is not None and last_flat.shape == flat.shape
+                    and np.abs(flat - last_flat).sum() < 0.02 * flat.size):
+                return getattr(websocket, '_last_response', None)
+            websocket._last_flat = flat
+
+            # Initialize recognition variables
+            predicted_word = "UNKNOWN"
+            confidence = 0.0
+
+            # Try advanced recognizer first if available
+            if advanced_recognizer and json_data.get("type") == "holistic":
+                frame_data = {
+                    "timestamp": datetime.now().timestamp(),
+                    "leftHandLandmarks": holistic_data.get("leftHandLandmarks"),
+                    "rightHandLandmarks": holistic_data.get("rightHandLandmarks"),
+                    "poseLandmarks": pose_landmarks,
+                    "faceLandmarks": face_landmarks
+                }
+
+                recognized = advanced_recognizer.process_frame(frame_data)
+                if recognized:
+                    predicted_word = recognized.sign
+                    confidence = recognized.confidence
+
+                    # Send additional metadata
+                    await websocket.send_text(json_dumps({
+                        "type": "gesture_metadata",
+                        "hand": recognized.hand,
+                        "is_motion": recognized.is_motion,
+                        "duration": recognized.duration,
+                        "frames": recognized.frames
+                    }))
+
+            # Rolling history for dynamic recognition: deque rotates in O(1)
+            # where list.pop(0) shifted every element per frame. Store the
+            # primary hand's landmark list - that is the per-frame shape the
+            # motion-feature extraction in the ASL recognizer indexes into
+            # (appending the whole hands list made it raise on every call).
+            if not hasattr(websocket, 'gesture_history'):
+                websocket.gesture_history = deque(maxlen=30)
+
+            websocket.gesture_history.append(pose_data[0])
+
+            # Try dynamic recognition if we have enough frames
+            if len(websocket.gesture_history) >= 5:
+                dict_word, dict_confidence = asl_recognizer.recognize_dynamic_sign(
+                    list(websocket.gesture_history),
+                    pose_sequence=[pose_landmarks] if pose_landmarks else None,
+                    face_sequence=[face_landmarks] if face_landmarks else None
+                )
+                if dict_confidence > confidence:
+                    predicted_word = dict_word
+                    confidence = dict_confidence
+            else:
+                # Try static recognition
+                if pose_data and len(pose_data) > 0:
+                    static_word, static_confidence = asl_recognizer.recognize_static_sign(
+                        pose_data[0] if pose_data else [],
+                        pose_landmarks,
+                        face_landmarks
+                    )
+                    if static_confidence > confidence:
+                        predicted_word = static_word
+                        confidence = static_confidence
+
+            # If ASL recognition fails, try the ML model (microbatched
+            # across connections). Failures resolve to ("Unknown", 0.0)
+            # inside the service/batcher, so no per-frame try/except here.
+            if confidence < 0.5 and inference_service.is_loaded:
+                ml_word, ml_confidence = await inference_batcher.submit(pose_data)
+                if ml_confidence > confidence:
+                    predicted_word, confidence = ml_word, ml_confidence
+                    logger.debug("ML Model prediction: %s (%.2f)", predicted_word, ml_confidence)
+
+            # Final fallback to rule-based
+            if confidence < 0.3:
+                rule_word, rule_confidence = process_sign_language(pose_data)
+                if rule_confidence > confidence:
+                    predicted_word, confidence = rule_word, rule_confidence
+
+            # Return prediction for batching (with filtering)
+            # Only send if confidence is reasonable or if it's a clear gesture
+            response = None
+            if confidence > 0.4 or (predicted_word != "UNKNOWN" and confidence > 0.3):
+                response = prediction_response(predicted_word, confidence)
+            websocket._last_response = response
+            return response
+
+        elif json_data.get("type") == "speech":
+            # Handle speech to sign conversion
+            text = json_data.get("text", "")
+
+            if text:
+                # Convert text to sign sequence
+                signs = text_to_signs(text)
+
+                if signs:
+                    await websocket.send_text(json_dumps({
+                        "type": "signs",
+                        "signs": signs,
+                        "original_text": text,
+                        "timestamp": datetime.now().isoformat()
+                    }))
+                else:
+                    await websocket.send_text(json_dumps({
+                        "type": "error",
+                        "message": "No signs found for text",
+                        "text": text
+                    }))
+
+        elif "landmarks" in json_data:
+            # Legacy format support
+            landmarks = json_data["landmarks"]
+            logger.debug("Received hand landmarks: %d points", len(landmarks))
+
+            # Early reject incomplete hands before any processing
+            if not landmarks or len(landmarks) < 21:
+                return None
+
+            # Convert to new format and process
+            pose_data = [landmarks] if landmarks else []
+            predicted_word, confidence = process_sign_language(pose_data)
+
+            # Only send if confidence is high enough
+            if confidence > 0.5 and predicted_word != "Unknown":
+                return prediction_response(predicted_word, confidence, key="word")
+        else:
+            logger.warning("Received unknown data format: %s", json_data)
+            await websocket.send_text(_ERROR_UNKNOWN_FORMAT)
+
+    except ValueError as e:
+        # Covers both json.JSONDecodeError and orjson.JSONDecodeError
+        logger.error(f"Invalid JSON received: {e}")
+        await websocket.send_text(json_dumps({
+            "status": "error",
+            "message": "Invalid JSON format",
+            "error": str(e)
+        }))
+
+    except Exception as e:
+        logger.error(f"Error processing data: {e}")
+        await websocket.send_text(json_dumps({
+            "status": "error",
+            "message": "Error processing hand coordinates",
+            "error": str(e)
+        }))
+
+    return None
+
 @router.websocket("/ws/sign")
 async def websocket_sign_endpoint(websocket: WebSocket):
     """
@@ -436,205 +976,68 @@ async def websocket_sign_endpoint(websocket: WebSocket):
     # Use enhanced handler with ML support
     await sign_handler.connect(websocket)
     
+    queue: asyncio.Queue = asyncio.Queue(maxsize=MAX_WS_BATCH)
+    reader = asyncio.create_task(frame_reader(websocket, queue))
+    
+    # Reusable per-connection landmark buffer for binary frames
+    scratch = np.empty((2, 21, 3), dtype=np.float32)
+    
+    # Last prediction shipped to this client, for duplicate suppression
+    last_sent_key = None
+    repeat_count = 0
+    
     try:
         while True:
-            # Receive data from client
-            data = await websocket.receive_text()
+            # Block on the first frame, then drain whatever else the reader
+            # already queued so a burst of pose frames costs one response
+            batch = [await queue.get()]
+            while len(batch) < MAX_WS_BATCH:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
             
-            try:
-                # Parse the JSON data
-                json_data = json.loads(data)
-                
-                # Check data type
-                if json_data.get("type") == "landmarks" or json_data.get("type") == "holistic":
-                    # Handle both simple landmarks and holistic data
-                    if json_data.get("type") == "holistic":
-                        # Extract hand landmarks from holistic data
-                        holistic_data = json_data.get("data", {})
-                        pose_data = []
-                        
-                        if holistic_data.get("leftHandLandmarks"):
-                            pose_data.append(holistic_data["leftHandLandmarks"])
-                        if holistic_data.get("rightHandLandmarks"):
-                            pose_data.append(holistic_data["rightHandLandmarks"])
-                            
-                        # Also extract pose and face for advanced recognition
-                        pose_landmarks = holistic_data.get("poseLandmarks")
-                        face_landmarks = holistic_data.get("faceLandmarks")
-                    else:
-                        # Simple landmarks format
-                        pose_data = json_data.get("data", [])
-                        pose_landmarks = None
-                        face_landmarks = None
-                    
-                    if not pose_data or len(pose_data) == 0:
-                        logger.warning("Received empty pose data")
-                        continue
-                    
-                    logger.info(f"Received pose data: {len(pose_data)} hands")
-                    
-                    # Initialize recognition variables
-                    predicted_word = "UNKNOWN"
-                    confidence = 0.0
-                    
-                    # Try advanced recognizer first if available
-                    if advanced_recognizer and json_data.get("type") == "holistic":
-                        frame_data = {
-                            "timestamp": datetime.now().timestamp(),
-                            "leftHandLandmarks": holistic_data.get("leftHandLandmarks"),
-                            "rightHandLandmarks": holistic_data.get("rightHandLandmarks"),
-                            "poseLandmarks": pose_landmarks,
-                            "faceLandmarks": face_landmarks
-                        }
-                        
-                        recognized = advanced_recognizer.process_frame(frame_data)
-                        if recognized:
-                            predicted_word = recognized.sign
-                            confidence = recognized.confidence
-                            
-                            # Send additional metadata
-                            await websocket.send_text(json.dumps({
-                                "type": "gesture_metadata",
-                                "hand": recognized.hand,
-                                "is_motion": recognized.is_motion,
-                                "duration": recognized.duration,
-                                "frames": recognized.frames
-                            }))
-                    
-                    # Fallback to ASL dictionary if advanced recognition didn't work
-                    if confidence < 0.5:
-                        # Try ASL dictionary recognition
-                        asl_recognizer = get_asl_recognizer()
-                    
-                    # Store in gesture history for dynamic recognition
-                    if not hasattr(websocket, 'gesture_history'):
-                        websocket.gesture_history = []
-                    
-                    websocket.gesture_history.append(pose_data)
-                    if len(websocket.gesture_history) > 30:  # Keep last 30 frames
-                        websocket.gesture_history.pop(0)
-                    
-                    # Try dynamic recognition if we have enough frames
-                    if len(websocket.gesture_history) >= 5:
-                        dict_word, dict_confidence = asl_recognizer.recognize_dynamic_sign(
-                            websocket.gesture_history,
-                            pose_sequence=[pose_landmarks] if pose_landmarks else None,
-                            face_sequence=[face_landmarks] if face_landmarks else None
-                        )
-                        if dict_confidence > confidence:
-                            predicted_word = dict_word
-                            confidence = dict_confidence
-                    else:
-                        # Try static recognition
-                        if pose_data and len(pose_data) > 0:
-                            static_word, static_confidence = asl_recognizer.recognize_static_sign(
-                                pose_data[0] if pose_data else [],
-                                pose_landmarks,
-                                face_landmarks
-                            )
-                            if static_confidence > confidence:
-                                predicted_word = static_word
-                                confidence = static_confidence
-                    
-                    # If ASL recognition fails, try ML model
-                    if confidence < 0.5:
-                        inference_service = get_inference_service()
-                        if inference_service.is_loaded:
-                            try:
-                                ml_word, ml_confidence = inference_service.predict(pose_data)
-                                if ml_confidence > confidence:
-                                    predicted_word, confidence = ml_word, ml_confidence
-                                    logger.info(f"ML Model prediction: {predicted_word} ({confidence:.2f})")
-                            except Exception as e:
-                                logger.warning(f"ML model prediction failed: {e}")
-                    
-                    # Final fallback to rule-based
-                    if confidence < 0.3:
-                        rule_word, rule_confidence = process_sign_language(pose_data)
-                        if rule_confidence > confidence:
-                            predicted_word, confidence = rule_word, rule_confidence
-                    
-                    # Send prediction back to client (with filtering)
-                    # Only send if confidence is reasonable or if it's a clear gesture
-                    if confidence > 0.4 or (predicted_word != "UNKNOWN" and confidence > 0.3):
-                        await websocket.send_text(json.dumps({
-                            "type": "prediction",
-                            "sign": predicted_word,
-                            "confidence": confidence,
-                            "timestamp": datetime.now().isoformat()
-                        }))
-                    
-                elif json_data.get("type") == "speech":
-                    # Handle speech to sign conversion
-                    text = json_data.get("text", "")
-                    
-                    if text:
-                        # Convert text to sign sequence
-                        signs = text_to_signs(text)
-                        
-                        if signs:
-                            await websocket.send_text(json.dumps({
-                                "type": "signs",
-                                "signs": signs,
-                                "original_text": text,
-                                "timestamp": datetime.now().isoformat()
-                            }))
-                        else:
-                            await websocket.send_text(json.dumps({
-                                "type": "error",
-                                "message": "No signs found for text",
-                                "text": text
-                            }))
-                    
-                elif "landmarks" in json_data:
-                    # Legacy format support
-                    landmarks = json_data["landmarks"]
-                    logger.info(f"Received hand landmarks: {len(landmarks)} points")
-                    
-                    # Convert to new format and process
-                    pose_data = [landmarks] if landmarks else []
-                    predicted_word, confidence = process_sign_language(pose_data)
-                    
-                    # Only send if confidence is high enough
-                    if confidence > 0.5 and predicted_word != "Unknown":
-                        response = {
-                            "type": "prediction",
-                            "word": predicted_word,
-                            "confidence": confidence
-                        }
-                        await websocket_manager.send_json(websocket, response)
-                else:
-                    logger.info(f"Received unknown data format: {json_data}")
-                    response = {
-                        "type": "error",
-                        "message": "Unknown data format"
-                    }
-                    await websocket_manager.send_json(websocket, response)
-                
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON received: {e}")
-                error_response = {
-                    "status": "error",
-                    "message": "Invalid JSON format",
-                    "error": str(e)
-                }
-                await websocket_manager.send_json(websocket, error_response)
-                
-            except Exception as e:
-                logger.error(f"Error processing data: {e}")
-                error_response = {
-                    "status": "error",
-                    "message": "Error processing hand coordinates",
-                    "error": str(e)
-                }
-                await websocket_manager.send_json(websocket, error_response)
+            predictions = []
+            for data in batch:
+                if data is _DISCONNECT:
+                    raise WebSocketDisconnect(1000)
+                response = await handle_sign_message(websocket, data, scratch)
+                if response is not None:
+                    predictions.append(response)
+            
+            # Held signs produce identical predictions frame after frame;
+            # suppress the repeats (with a periodic refresh) so steady state
+            # costs no serialization or send at all
+            to_send = []
+            for response, payload in predictions:
+                key = (response.get("sign") or response.get("word"),
+                       int(response["confidence"] * 100))
+                if key == last_sent_key and repeat_count < PREDICTION_REFRESH_FRAMES:
+                    repeat_count += 1
+                    continue
+                last_sent_key = key
+                repeat_count = 0
+                to_send.append((response, payload))
+            
+            # Ship one frame: unwrapped when idle, batched under load.
+            # Single predictions reuse their pre-serialized payload directly.
+            if len(to_send) == 1:
+                await websocket.send_text(to_send[0][1])
+            elif to_send:
+                await websocket.send_text(json_dumps({
+                    "type": "prediction_batch",
+                    "items": [response for response, _ in to_send]
+                }))
                 
     except WebSocketDisconnect:
         logger.info("WebSocket disconnected")
-        await sign_handler.disconnect(websocket)
+        sign_handler.disconnect(websocket)
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
-        await sign_handler.disconnect(websocket)
+        sign_handler.disconnect(websocket)
+    finally:
+        reader.cancel()
+
 
 # Health check endpoint
 @router.get("/health")
@@ -7,12 +7,14 @@ This script helps you collect hand landmark data for training the model
 import cv2
 import mediapipe as mp
 import numpy as np
-import os
 import json
+import queue
+import threading
 from pathlib import Path
 from datetime import datetime
 import time
-from database import SessionLocal, save_training_sample, initialize_signs
+from database import (SessionLocal, Sign, get_or_create_sign,
+                      save_training_samples_for_id, initialize_signs)
 
 # Initialize MediaPipe
 mp_hands = mp.solutions.hands
@@ -32,6 +34,51 @@ FRAMES_PER_SAMPLE = 30  # Number of frames per sample
 DATA_PATH = Path('training_data')
 
 
+class FrameReader:
+    """
+    Background camera reader for the recording window.
+
+    Capture (read + mirror flip) runs on its own thread behind a bounded
+    queue so the camera keeps pace while the main thread sits inside
+    MediaPipe inference; when the queue is full the oldest frame is
+    dropped. MediaPipe stays on the main thread (a Hands instance is not
+    thread-safe) and highgui rendering must too, so this is a two-stage
+    pipeline rather than the full three stages.
+    """
+
+    def __init__(self, cap, maxsize=2):
+        self.cap = cap
+        self.frames = queue.Queue(maxsize=maxsize)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            ret, frame = self.cap.read()
+            if not ret:
+                continue
+            # Horizontal flip works in place - no second frame-sized buffer
+            cv2.flip(frame, 1, dst=frame)
+            if self.frames.full():
+                try:
+                    self.frames.get_nowait()
+                except queue.Empty:
+                    pass
+            self.frames.put(frame)
+
+    def read(self, timeout=1.0):
+        """Pop the next frame, or None if the camera stalled."""
+        try:
+            return self.frames.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join(timeout=2.0)
+
+
 class TrainingDataCollector:
     def __init__(self):
         self.hands = mp_hands.Hands(
@@ -41,28 +88,77 @@ class TrainingDataCollector:
             min_tracking_confidence=0.5
         )
         self.cap = cv2.VideoCapture(0)
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+        # MediaPipe resizes hands to ~224px internally: capturing at 720p
+        # just moves (and converts) 4x the pixels for identical landmarks
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 360)
+        # Single-frame driver buffer: without it V4L2 queues ~4 stale frames,
+        # adding >100 ms between the hand moving and MediaPipe seeing it
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        # MJPG decodes far cheaper than H.264 at this resolution
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
         self.db = SessionLocal()
         
+        # Reusable RGB conversion buffer (see to_rgb)
+        self._rgb_buf = None
+        
+        # The collected signs are a fixed set: resolve word -> id once at
+        # startup rather than a SELECT per flush
+        self._sign_ids = dict(self.db.query(Sign.word, Sign.id).all())
+        
         # Create data directory
         DATA_PATH.mkdir(exist_ok=True)
         
-    def extract_landmarks(self, results):
-        """Extract hand landmarks from MediaPipe results"""
+        # Background writer: compressing and saving a sample's NPZ happens
+        # off the capture path so the next sample can start immediately.
+        # Database flushes stay on the main thread - the session isn't
+        # thread-safe and they already run only once per sign.
+        self._write_queue = queue.Queue(maxsize=8)
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+        
+    def _write_loop(self):
+        """Drain queued (path, array) pairs until the sentinel arrives."""
+        while True:
+            item = self._write_queue.get()
+            if item is None:
+                break
+            sample_path, arr = item
+            np.savez_compressed(sample_path, seq=arr)
+        
+    def to_rgb(self, frame):
+        """Convert a BGR frame to RGB into a reused buffer (no per-frame alloc)."""
+        if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+            self._rgb_buf = np.empty_like(frame)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        return self._rgb_buf
+    
+    def draw_and_extract(self, results, frame, out):
+        """
+        Walk the detected hands once, drawing the overlay onto frame and
+        packing coordinates into out (a (126,) float32 slot; untouched
+        zeros pad a missing second hand).
+
+        Returns True if any hand was packed.
+        """
         if not results.multi_hand_landmarks:
-            return None
+            return False
             
-        landmarks = []
-        for hand_landmarks in results.multi_hand_landmarks:
-            for lm in hand_landmarks.landmark:
-                landmarks.extend([lm.x, lm.y, lm.z])
-                
-        # Pad with zeros if only one hand detected (we expect 2 hands max)
-        while len(landmarks) < 21 * 3 * 2:  # 21 landmarks * 3 coords * 2 hands
-            landmarks.append(0.0)
+        for i, hand_landmarks in enumerate(results.multi_hand_landmarks[:2]):
+            mp_drawing.draw_landmarks(
+                frame,
+                hand_landmarks,
+                mp_hands.HAND_CONNECTIONS,
+                mp_drawing_styles.get_default_hand_landmarks_style(),
+                mp_drawing_styles.get_default_hand_connections_style()
+            )
+            out[i * 63:(i + 1) * 63] = np.fromiter(
+                (c for lm in hand_landmarks.landmark for c in (lm.x, lm.y, lm.z)),
+                dtype=np.float32,
+                count=63
+            )
             
-        return landmarks[:21 * 3 * 2]  # Ensure consistent size
+        return True
     
     def collect_samples(self, sign_name, num_samples=SAMPLES_PER_SIGN):
         """Collect training samples for a specific sign"""
@@ -76,19 +172,41 @@ class TrainingDataCollector:
         sign_path = DATA_PATH / sign_name
         sign_path.mkdir(exist_ok=True)
         
+        # Samples are buffered and written to the database in one batch at
+        # the end of the sign, keeping fsyncs out of the recording loop
+        pending_sequences = []
+        
         samples_collected = 0
+        last_render = 0.0
+        preview_count = 0
+        preview_results = None
         
         while samples_collected < num_samples:
-            ret, frame = self.cap.read()
+            # Idle preview: grab() advances the stream without decoding;
+            # only retrieve (decode) the frames we actually render
+            if not self.cap.grab():
+                continue
+            
+            now = time.monotonic()
+            if now - last_render < 1 / 30:
+                continue
+            last_render = now
+            
+            ret, frame = self.cap.retrieve()
             if not ret:
                 continue
                 
-            # Flip frame horizontally for mirror effect
-            frame = cv2.flip(frame, 1)
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            # Flip frame horizontally for mirror effect (in place)
+            cv2.flip(frame, 1, dst=frame)
             
-            # Process with MediaPipe
-            results = self.hands.process(frame_rgb)
+            # The idle preview needs responsiveness, not precision: detect
+            # only every 3rd rendered frame, reusing the last result for the
+            # overlay in between (capture is already at detection-friendly
+            # 640x360, so no extra downscale is needed)
+            preview_count += 1
+            if preview_count % 3 == 1 or preview_results is None:
+                preview_results = self.hands.process(self.to_rgb(frame))
+            results = preview_results
             
             # Draw hand landmarks
             if results.multi_hand_landmarks:
@@ -114,52 +232,60 @@ class TrainingDataCollector:
             key = cv2.waitKey(1) & 0xFF
             
             if key == ord(' '):  # Space bar to start recording
-                # Record a sequence of frames
+                # Record a sequence of frames into a preallocated SoA
+                # buffer - frames land in place, nothing grows per frame
                 print(f"Recording sample {samples_collected + 1}...")
-                sequence = []
+                sequence = np.zeros((FRAMES_PER_SAMPLE, 21 * 3 * 2), dtype=np.float32)
+                captured = 0
+                
+                # Overlap capture with MediaPipe inference for the recording
+                # window so we don't drop frames while the model runs
+                reader = FrameReader(self.cap)
+                
+                # Rasterize the static RECORDING banner once per sample and
+                # blit it each frame; only the counter needs a putText call
+                banner = np.zeros((45, 260, 3), dtype=np.uint8)
+                cv2.putText(banner, "RECORDING", (10, 30),
+                           cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
+                banner_mask = banner.any(axis=2)
                 
                 for frame_num in range(FRAMES_PER_SAMPLE):
-                    ret, frame = self.cap.read()
-                    if not ret:
+                    frame = reader.read()
+                    if frame is None:
                         continue
                         
-                    frame = cv2.flip(frame, 1)
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                    frame_rgb = self.to_rgb(frame)
                     results = self.hands.process(frame_rgb)
                     
-                    landmarks = self.extract_landmarks(results)
-                    if landmarks:
-                        sequence.append(landmarks)
+                    # Single pass over the protobuf hands: draw the visual
+                    # feedback and pack the coordinates together
+                    if self.draw_and_extract(results, frame, sequence[captured]):
+                        captured += 1
                     
-                    # Visual feedback during recording
-                    if results.multi_hand_landmarks:
-                        for hand_landmarks in results.multi_hand_landmarks:
-                            mp_drawing.draw_landmarks(
-                                frame,
-                                hand_landmarks,
-                                mp_hands.HAND_CONNECTIONS,
-                                mp_drawing_styles.get_default_hand_landmarks_style(),
-                                mp_drawing_styles.get_default_hand_connections_style()
-                            )
-                    
-                    # Show recording indicator
-                    cv2.putText(frame, "RECORDING", (10, 30),
-                               cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
+                    # Show recording indicator (precomputed banner + counter)
+                    frame[:45, :260][banner_mask] = banner[banner_mask]
                     cv2.putText(frame, f"Frame: {frame_num + 1}/{FRAMES_PER_SAMPLE}", (10, 70),
                                cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
                     
                     cv2.imshow('Collect Training Data', frame)
-                    cv2.waitKey(1)
+                    # pollKey pumps GUI events without waitKey's forced
+                    # 1 ms sleep per frame (30 ms per sample)
+                    cv2.pollKey()
+                
+                reader.stop()
                 
                 # Save the sequence
-                if len(sequence) == FRAMES_PER_SAMPLE:
-                    # Save to file
-                    sample_path = sign_path / f"sample_{samples_collected}.json"
-                    with open(sample_path, 'w') as f:
-                        json.dump(sequence, f)
+                if captured == FRAMES_PER_SAMPLE:
+                    # Save to file: compressed float16 NPZ is 10-30x smaller
+                    # than JSON text and loads straight into an array at
+                    # training time (landmarks are normalized [0,1], so
+                    # fp16 precision is plenty)
+                    sample_path = sign_path / f"sample_{samples_collected}.npz"
+                    self._write_queue.put((sample_path, sequence.astype(np.float16)))
                     
-                    # Save to database
-                    save_training_sample(self.db, sign_name, sequence, user_id="collector")
+                    # Buffer for the end-of-sign bulk database insert
+                    # (JSON column wants plain lists)
+                    pending_sequences.append(sequence.tolist())
                     
                     samples_collected += 1
                     print(f"Sample {samples_collected} saved!")
@@ -173,6 +299,14 @@ class TrainingDataCollector:
                 print(f"Skipping {sign_name}")
                 break
                 
+        if pending_sequences:
+            sign_id = self._sign_ids.get(sign_name)
+            if sign_id is None:
+                sign_id = get_or_create_sign(self.db, sign_name).id
+                self._sign_ids[sign_name] = sign_id
+            save_training_samples_for_id(self.db, sign_id, pending_sequences,
+                                         user_id="collector")
+        
         print(f"Completed collecting {samples_collected} samples for {sign_name}")
         
     def collect_all_signs(self):
@@ -200,6 +334,10 @@ class TrainingDataCollector:
         
     def cleanup(self):
         """Clean up resources"""
+        # Flush pending sample writes before tearing anything down
+        self._write_queue.put(None)
+        self._writer.join(timeout=10.0)
+        
         self.cap.release()
         cv2.destroyAllWindows()
         self.db.close()
@@ -4,10 +4,10 @@ Supports both SQLite (development) and PostgreSQL (production)
 """
 
 import os
-import json
+from collections import defaultdict
 from datetime import datetime
 from typing import Optional, List, Dict
-from sqlalchemy import create_engine, Column, Integer, String, Float, JSON, DateTime, ForeignKey, Text
+from sqlalchemy import create_engine, event, func, inspect, Column, Integer, String, Float, JSON, DateTime, ForeignKey, Text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship, Session
 from pathlib import Path
@@ -23,6 +23,17 @@ engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False} i
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+if "sqlite" in DATABASE_URL:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, connection_record):
+        """WAL journaling + relaxed sync: small commits stop paying a full
+        fsync each (the collector writes one commit per recorded batch)."""
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
 # Database Models
 
 class Sign(Base):
@@ -49,10 +60,10 @@ class TrainingSample(Base):
     __tablename__ = "training_samples"
     
     id = Column(Integer, primary_key=True, index=True)
-    sign_id = Column(Integer, ForeignKey("signs.id"))
+    sign_id = Column(Integer, ForeignKey("signs.id"), index=True)
     landmarks = Column(JSON, nullable=False)  # Hand landmark data
     user_id = Column(String(100))  # Who provided this sample
-    quality_score = Column(Float)  # Quality of the sample (0-1)
+    quality_score = Column(Float, index=True)  # Quality of the sample (0-1)
     is_validated = Column(Integer, default=0)  # Has this been validated?
     created_at = Column(DateTime, default=datetime.utcnow)
     
@@ -69,6 +80,7 @@ class UserProgress(Base):
     sign_id = Column(Integer, ForeignKey("signs.id"))
     practice_count = Column(Integer, default=0)
     accuracy = Column(Float)  # Average accuracy (0-1)
+    accuracy_sum = Column(Float, default=0.0)  # Exact sum behind the average
     last_practiced = Column(DateTime)
     created_at = Column(DateTime, default=datetime.utcnow)
     
@@ -95,6 +107,40 @@ class ModelVersion(Base):
 Base.metadata.create_all(bind=engine)
 
 
+def _ensure_schema():
+    """
+    Apply additive schema changes to pre-existing databases.
+
+    create_all only creates missing tables - it never alters existing
+    ones - so columns introduced after a database was first created must
+    be added here, guarded by a schema probe.
+    """
+    inspector = inspect(engine)
+    if "user_progress" in inspector.get_table_names():
+        columns = {col["name"] for col in inspector.get_columns("user_progress")}
+        if "accuracy_sum" not in columns:
+            with engine.begin() as conn:
+                conn.exec_driver_sql(
+                    "ALTER TABLE user_progress ADD COLUMN accuracy_sum FLOAT"
+                )
+
+    # index=True on the model only materializes through create_all for
+    # freshly created tables; back-fill the training-sample lookup indexes
+    # on databases that predate them
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE INDEX IF NOT EXISTS ix_training_samples_sign_id "
+            "ON training_samples (sign_id)"
+        )
+        conn.exec_driver_sql(
+            "CREATE INDEX IF NOT EXISTS ix_training_samples_quality_score "
+            "ON training_samples (quality_score)"
+        )
+
+
+_ensure_schema()
+
+
 # Database helper functions
 
 def get_db():
@@ -131,26 +177,31 @@ def initialize_signs(db: Session):
          "description": "F handshapes in circle"},
     ]
     
-    for sign_data in basic_signs:
-        # Check if sign already exists
-        existing = db.query(Sign).filter(Sign.word == sign_data["word"]).first()
-        if not existing:
-            sign = Sign(**sign_data)
-            db.add(sign)
-    
-    db.commit()
+    # One query for the existing words, one bulk INSERT for the rest,
+    # instead of a SELECT per sign
+    existing = {word for (word,) in db.query(Sign.word).all()}
+    new_signs = [Sign(**sign_data) for sign_data in basic_signs
+                 if sign_data["word"] not in existing]
+    if new_signs:
+        db.add_all(new_signs)
+        db.commit()
     print(f"Initialized {len(basic_signs)} basic signs in database")
 
 
-def save_training_sample(db: Session, sign_word: str, landmarks: List, user_id: str = "anonymous"):
-    """Save a training sample to the database"""
+def get_or_create_sign(db: Session, sign_word: str) -> Sign:
+    """Fetch a sign by word, creating a custom entry if it doesn't exist"""
     sign = db.query(Sign).filter(Sign.word == sign_word).first()
     if not sign:
-        # Create new sign if it doesn't exist
         sign = Sign(word=sign_word, category="custom")
         db.add(sign)
         db.commit()
         db.refresh(sign)
+    return sign
+
+
+def save_training_sample(db: Session, sign_word: str, landmarks: List, user_id: str = "anonymous"):
+    """Save a training sample to the database"""
+    sign = get_or_create_sign(db, sign_word)
     
     sample = TrainingSample(
         sign_id=sign.id,
@@ -163,20 +214,54 @@ def save_training_sample(db: Session, sign_word: str, landmarks: List, user_id:
     return sample
 
 
+def save_training_samples(db: Session, sign_word: str, sequences: List[List],
+                          user_id: str = "anonymous") -> List:
+    """
+    Save a batch of training samples in a single transaction.
+
+    One Sign lookup and one commit for the whole batch, instead of a
+    SELECT + INSERT + fsync per sample.
+    """
+    if not sequences:
+        return []
+    
+    sign = get_or_create_sign(db, sign_word)
+    return save_training_samples_for_id(db, sign.id, sequences, user_id)
+
+
+def save_training_samples_for_id(db: Session, sign_id: int, sequences: List[List],
+                                 user_id: str = "anonymous") -> List:
+    """Bulk-insert samples for an already-resolved sign id (no SELECT at all)"""
+    samples = [
+        TrainingSample(
+            sign_id=sign_id,
+            landmarks=landmarks,
+            user_id=user_id,
+            quality_score=0.8
+        )
+        for landmarks in sequences
+    ]
+    db.add_all(samples)
+    db.commit()
+    return samples
+
+
 def get_training_data(db: Session, min_quality: float = 0.7) -> Dict:
     """Get all training data for model training"""
-    samples = db.query(TrainingSample).filter(
-        TrainingSample.quality_score >= min_quality
-    ).all()
+    # Project just the two needed columns through a join: one query, no ORM
+    # instances, and no lazy sample.sign SELECT per row (N+1)
+    rows = (
+        db.query(Sign.word, TrainingSample.landmarks)
+        .join(TrainingSample, TrainingSample.sign_id == Sign.id)
+        .filter(TrainingSample.quality_score >= min_quality)
+        .all()
+    )
     
-    data = {}
-    for sample in samples:
-        sign_word = sample.sign.word
-        if sign_word not in data:
-            data[sign_word] = []
-        data[sign_word].append(sample.landmarks)
+    data = defaultdict(list)
+    for sign_word, landmarks in rows:
+        data[sign_word].append(landmarks)
     
-    return data
+    return dict(data)
 
 
 def update_user_progress(db: Session, user_id: str, sign_word: str, accuracy: float):
@@ -196,16 +281,30 @@ def update_user_progress(db: Session, user_id: str, sign_word: str, accuracy: fl
             sign_id=sign.id,
             practice_count=1,
             accuracy=accuracy,
+            accuracy_sum=accuracy,
             last_practiced=datetime.utcnow()
         )
         db.add(progress)
-    else:
-        progress.practice_count += 1
-        # Update running average accuracy
-        progress.accuracy = (progress.accuracy * (progress.practice_count - 1) + accuracy) / progress.practice_count
-        progress.last_practiced = datetime.utcnow()
+        db.commit()
+        return progress
     
+    # Accumulate the exact sum and derive the mean from it: a single atomic
+    # UPDATE with no read-modify-write, and no drift from repeatedly
+    # rescaling the running average. Rows created before the column existed
+    # (added by _ensure_schema) hold NULL, so coalesce seeds their sum from
+    # the legacy running average.
+    accuracy_sum = func.coalesce(
+        UserProgress.accuracy_sum,
+        UserProgress.accuracy * UserProgress.practice_count
+    ) + accuracy
+    db.query(UserProgress).filter(UserProgress.id == progress.id).update({
+        UserProgress.accuracy_sum: accuracy_sum,
+        UserProgress.accuracy: accuracy_sum / (UserProgress.practice_count + 1),
+        UserProgress.practice_count: UserProgress.practice_count + 1,
+        UserProgress.last_practiced: datetime.utcnow()
+    }, synchronize_session=False)
     db.commit()
+    db.refresh(progress)
     return progress
 
 
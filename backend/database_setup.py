@@ -6,22 +6,66 @@ SQLite database for training data, gestures, and feedback
 import sqlite3
 import json
 import os
+import queue
+from contextlib import contextmanager
+import numpy as np
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Hot-path SQL as module constants: passing the same interned string to
+# conn.execute lets sqlite3's per-connection statement cache reuse the
+# prepared statement instead of re-parsing the SQL text per call
+_INSERT_SEQUENCE_SQL = '''
+    INSERT INTO training_sequences (gesture_name, sequence_data, frame_count)
+    VALUES (?, ?, ?)
+'''
+
+_UPSERT_GESTURE_SQL = '''
+    INSERT INTO gestures (name, description, category, difficulty)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(name) DO UPDATE SET
+        description = excluded.description,
+        category = excluded.category,
+        difficulty = excluded.difficulty
+'''
+
+_INSERT_LOG_SQL = '''
+    INSERT INTO inference_logs 
+    (gesture_detected, confidence, processing_time_ms, model_version)
+    VALUES (?, ?, ?, ?)
+'''
+
+_INSERT_FEEDBACK_SQL = '''
+    INSERT INTO feedback 
+    (gesture_predicted, gesture_actual, confidence, correct, user_id, session_id)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+_INSERT_MODEL_METADATA_SQL = '''
+    INSERT INTO model_metadata 
+    (model_name, model_path, accuracy, val_accuracy, training_samples, epochs)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
 class SignDatabase:
     """Database manager for sign language data."""
     
+    # Flush buffered inference logs once this many rows accumulate
+    LOG_BUFFER_SIZE = 100
+    
+    # Read-only connections serving SELECTs concurrently with the writer
+    READER_POOL_SIZE = 4
+    
     def __init__(self, db_path: str = 'database/signs.db'):
         """Initialize database connection."""
         self.db_path = db_path
         os.makedirs(os.path.dirname(db_path) if os.path.dirname(db_path) else '.', exist_ok=True)
         self.conn = None
         self.cursor = None
+        self._log_buffer: List[tuple] = []
         self.connect()
         self.create_tables()
     
@@ -30,7 +74,40 @@ class SignDatabase:
         self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
         self.cursor = self.conn.cursor()
-        logger.info(f"Connected to database: {self.db_path}")
+        
+        # WAL + tuned pragmas: commits stop paying a full rollback-journal
+        # fsync (inference logging is a high-frequency writer) and readers
+        # no longer block behind writers
+        self.cursor.execute("PRAGMA journal_mode=WAL")
+        self.cursor.execute("PRAGMA synchronous=NORMAL")
+        self.cursor.execute("PRAGMA busy_timeout=5000")
+        self.cursor.execute("PRAGMA cache_size=-20000")
+        self.cursor.execute("PRAGMA temp_store=MEMORY")
+        self.cursor.execute("PRAGMA foreign_keys=ON")
+        
+        journal_mode = self.cursor.execute("PRAGMA journal_mode").fetchone()[0]
+        
+        # Reader pool: with WAL active these serve SELECTs without ever
+        # queueing behind the single writer connection above
+        self._readers: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        for _ in range(self.READER_POOL_SIZE):
+            reader = sqlite3.connect(self.db_path, check_same_thread=False)
+            reader.row_factory = sqlite3.Row
+            reader.execute("PRAGMA query_only=ON")
+            reader.execute("PRAGMA busy_timeout=5000")
+            reader.execute("PRAGMA cache_size=-20000")
+            self._readers.put(reader)
+        
+        logger.info(f"Connected to database: {self.db_path} (journal_mode={journal_mode})")
+    
+    @contextmanager
+    def _read_conn(self):
+        """Borrow a read-only connection from the pool."""
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
     
     def create_tables(self):
         """Create database tables if they don't exist."""
@@ -99,6 +176,30 @@ class SignDatabase:
             )
         ''')
         
+        # Covering index for the hot reads: get_training_sequences filters
+        # by gesture and orders by recency, statistics group by gesture
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_ts_gest_created 
+            ON training_sequences(gesture_name, created_at DESC)
+        ''')
+        
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_inflog_created 
+            ON inference_logs(created_at DESC)
+        ''')
+        
+        self.cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_ts_sample_count
+            AFTER INSERT ON training_sequences
+            BEGIN
+                UPDATE gestures SET sample_count = sample_count + 1
+                WHERE name = NEW.gesture_name;
+            END
+        ''')
+        
+        # Refresh planner statistics so the new indexes actually get picked
+        self.cursor.execute('ANALYZE')
+        
         self.conn.commit()
         logger.info("Database tables created/verified")
     
@@ -107,95 +208,105 @@ class SignDatabase:
         if frame_count is None:
             frame_count = len(sequence_data)
         
-        sequence_json = json.dumps(sequence_data)
-        
-        self.cursor.execute('''
-            INSERT INTO training_sequences (gesture_name, sequence_data, frame_count)
-            VALUES (?, ?, ?)
-        ''', (gesture_name, sequence_json, frame_count))
+        # Landmarks are fixed-shape numerics: pack them as a float32 BLOB
+        # (~6x smaller than JSON text, decoded by pointer cast on read).
+        # SQLite's dynamic typing stores bytes in the legacy TEXT column.
+        blob = sqlite3.Binary(np.asarray(sequence_data, dtype=np.float32).tobytes())
         
+        cursor = self.conn.execute(_INSERT_SEQUENCE_SQL,
+                                   (gesture_name, blob, frame_count))
         self.conn.commit()
         
-        # Update gesture sample count
-        self.update_gesture_sample_count(gesture_name)
-        
-        return self.cursor.lastrowid
+        # Sample counts are maintained by the AFTER INSERT trigger
+        return cursor.lastrowid
     
     def insert_gesture(self, name: str, description: str = None, 
                       category: str = None, difficulty: str = 'beginner') -> int:
-        """Insert or update a gesture definition."""
-        try:
-            self.cursor.execute('''
-                INSERT INTO gestures (name, description, category, difficulty)
-                VALUES (?, ?, ?, ?)
-            ''', (name, description, category, difficulty))
-            self.conn.commit()
-            logger.info(f"Added gesture: {name}")
-            return self.cursor.lastrowid
-        except sqlite3.IntegrityError:
-            # Gesture already exists, update it
-            self.cursor.execute('''
-                UPDATE gestures 
-                SET description = ?, category = ?, difficulty = ?
-                WHERE name = ?
-            ''', (description, category, difficulty, name))
-            self.conn.commit()
-            logger.info(f"Updated gesture: {name}")
-            return self.cursor.lastrowid
+        """Insert or update a gesture definition (single upsert round-trip)."""
+        cursor = self.conn.execute(_UPSERT_GESTURE_SQL,
+                                   (name, description, category, difficulty))
+        self.conn.commit()
+        logger.info(f"Upserted gesture: {name}")
+        return cursor.lastrowid
+    
+    def insert_gestures_bulk(self, gestures: List[Dict]):
+        """Upsert many gesture definitions in a single transaction."""
+        with self.conn:
+            self.conn.executemany(_UPSERT_GESTURE_SQL, [
+                (g['name'], g.get('description'), g.get('category'),
+                 g.get('difficulty', 'beginner'))
+                for g in gestures
+            ])
+        logger.info(f"Upserted {len(gestures)} gestures")
     
     def get_training_sequences(self, gesture_name: str = None) -> List[Dict]:
         """Get training sequences, optionally filtered by gesture."""
-        if gesture_name:
-            self.cursor.execute('''
-                SELECT * FROM training_sequences 
-                WHERE gesture_name = ?
-                ORDER BY created_at DESC
-            ''', (gesture_name,))
-        else:
-            self.cursor.execute('''
-                SELECT * FROM training_sequences 
-                ORDER BY created_at DESC
-            ''')
-        
-        rows = self.cursor.fetchall()
+        with self._read_conn() as conn:
+            if gesture_name:
+                rows = conn.execute('''
+                    SELECT * FROM training_sequences 
+                    WHERE gesture_name = ?
+                    ORDER BY created_at DESC
+                ''', (gesture_name,)).fetchall()
+            else:
+                rows = conn.execute('''
+                    SELECT * FROM training_sequences 
+                    ORDER BY created_at DESC
+                ''').fetchall()
         sequences = []
         
         for row in rows:
             sequences.append({
                 'id': row['id'],
                 'gesture_name': row['gesture_name'],
-                'sequence_data': json.loads(row['sequence_data']),
+                'sequence_data': self._decode_sequence(row['sequence_data'],
+                                                       row['frame_count']),
                 'frame_count': row['frame_count'],
                 'created_at': row['created_at']
             })
         
         return sequences
     
+    @staticmethod
+    def _decode_sequence(raw, frame_count):
+        """Decode a stored sequence: float32 BLOB, or legacy JSON text."""
+        if isinstance(raw, (bytes, memoryview)):
+            arr = np.frombuffer(raw, dtype=np.float32)
+            if frame_count:
+                arr = arr.reshape(frame_count, -1)
+            return arr.tolist()
+        return json.loads(raw)
+    
     def get_gestures(self) -> List[Dict]:
         """Get all gesture definitions."""
-        self.cursor.execute('SELECT * FROM gestures ORDER BY name')
-        return [dict(row) for row in self.cursor.fetchall()]
+        with self._read_conn() as conn:
+            return [dict(row) for row in
+                    conn.execute('SELECT * FROM gestures ORDER BY name')]
     
     def get_gesture_statistics(self) -> Dict:
         """Get statistics about training data."""
         stats = {}
         
-        # Total sequences
-        self.cursor.execute('SELECT COUNT(*) as total FROM training_sequences')
-        stats['total_sequences'] = self.cursor.fetchone()['total']
-        
-        # Sequences per gesture
-        self.cursor.execute('''
-            SELECT gesture_name, COUNT(*) as count 
-            FROM training_sequences 
-            GROUP BY gesture_name
-        ''')
-        stats['sequences_per_gesture'] = {row['gesture_name']: row['count'] 
-                                         for row in self.cursor.fetchall()}
-        
-        # Total gestures
-        self.cursor.execute('SELECT COUNT(*) as total FROM gestures')
-        stats['total_gestures'] = self.cursor.fetchone()['total']
+        with self._read_conn() as conn:
+            # Total sequences
+            stats['total_sequences'] = conn.execute(
+                'SELECT COUNT(*) as total FROM training_sequences'
+            ).fetchone()['total']
+            
+            # Sequences per gesture
+            stats['sequences_per_gesture'] = {
+                row['gesture_name']: row['count']
+                for row in conn.execute('''
+                    SELECT gesture_name, COUNT(*) as count 
+                    FROM training_sequences 
+                    GROUP BY gesture_name
+                ''')
+            }
+            
+            # Total gestures
+            stats['total_gestures'] = conn.execute(
+                'SELECT COUNT(*) as total FROM gestures'
+            ).fetchone()['total']
         
         return stats
     
@@ -203,42 +314,51 @@ class SignDatabase:
                             accuracy: float, val_accuracy: float,
                             training_samples: int, epochs: int) -> int:
         """Record model training metadata."""
-        self.cursor.execute('''
-            INSERT INTO model_metadata 
+        cursor = self.conn.execute(
+            _INSERT_MODEL_METADATA_SQL,
             (model_name, model_path, accuracy, val_accuracy, training_samples, epochs)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (model_name, model_path, accuracy, val_accuracy, training_samples, epochs))
-        
+        )
         self.conn.commit()
-        return self.cursor.lastrowid
+        return cursor.lastrowid
     
     def insert_feedback(self, gesture_predicted: str, gesture_actual: str,
                        confidence: float, correct: bool,
                        user_id: str = None, session_id: str = None) -> int:
         """Record user feedback for continuous improvement."""
-        self.cursor.execute('''
-            INSERT INTO feedback 
+        cursor = self.conn.execute(
+            _INSERT_FEEDBACK_SQL,
             (gesture_predicted, gesture_actual, confidence, correct, user_id, session_id)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (gesture_predicted, gesture_actual, confidence, correct, user_id, session_id))
-        
+        )
         self.conn.commit()
-        return self.cursor.lastrowid
+        return cursor.lastrowid
     
     def insert_inference_log(self, gesture_detected: str, confidence: float,
                            processing_time_ms: float, model_version: str = 'v1') -> int:
-        """Log inference results."""
-        self.cursor.execute('''
-            INSERT INTO inference_logs 
+        """
+        Log an inference result.
+
+        Rows are buffered and flushed in one transaction every
+        LOG_BUFFER_SIZE entries (and on close) - at realtime prediction
+        rates a commit+fsync per row would dominate the write path.
+        """
+        self._log_buffer.append(
             (gesture_detected, confidence, processing_time_ms, model_version)
-            VALUES (?, ?, ?, ?)
-        ''', (gesture_detected, confidence, processing_time_ms, model_version))
+        )
+        if len(self._log_buffer) >= self.LOG_BUFFER_SIZE:
+            self.flush_inference_logs()
+        return len(self._log_buffer)
+    
+    def flush_inference_logs(self):
+        """Write all buffered inference logs in a single transaction."""
+        if not self._log_buffer:
+            return
         
-        self.conn.commit()
-        return self.cursor.lastrowid
+        rows, self._log_buffer = self._log_buffer, []
+        with self.conn:
+            self.conn.executemany(_INSERT_LOG_SQL, rows)
     
     def update_gesture_sample_count(self, gesture_name: str):
-        """Update the sample count for a gesture."""
+        """Recount samples for a gesture (manual repair; inserts use the trigger)."""
         self.cursor.execute('''
             UPDATE gestures 
             SET sample_count = (
@@ -250,50 +370,83 @@ class SignDatabase:
         self.conn.commit()
     
     def export_training_data(self, output_file: str):
-        """Export all training data to JSON file."""
-        sequences = self.get_training_sequences()
+        """
+        Export all training data to JSON file.
+
+        Sequences are streamed row by row straight from the cursor, so
+        peak memory stays flat no matter how large the table is and no
+        intermediate list of dicts is built. (SQLite's native
+        json_group_array can't decode the float32 sequence BLOBs, so the
+        streaming happens here rather than in SQL.)
+        """
         gestures = self.get_gestures()
         
-        export_data = {
-            'gestures': gestures,
-            'sequences': sequences,
-            'exported_at': datetime.now().isoformat()
-        }
-        
         with open(output_file, 'w') as f:
-            json.dump(export_data, f, indent=2, default=str)
+            f.write('{"gestures": ')
+            json.dump(gestures, f, default=str)
+            f.write(', "sequences": [')
+            
+            first = True
+            with self._read_conn() as conn:
+                rows = conn.execute(
+                    'SELECT * FROM training_sequences ORDER BY created_at DESC')
+                for row in rows:
+                    if not first:
+                        f.write(', ')
+                    first = False
+                    json.dump({
+                        'id': row['id'],
+                        'gesture_name': row['gesture_name'],
+                        'sequence_data': self._decode_sequence(row['sequence_data'],
+                                                               row['frame_count']),
+                        'frame_count': row['frame_count'],
+                        'created_at': row['created_at']
+                    }, f, default=str)
+            
+            f.write('], "exported_at": %s}' % json.dumps(datetime.now().isoformat()))
         
         logger.info(f"Exported data to {output_file}")
     
     def import_training_data(self, input_file: str):
-        """Import training data from JSON file."""
+        """Import training data from JSON file in a single transaction."""
         with open(input_file, 'r') as f:
             data = json.load(f)
         
-        # Import gestures
-        for gesture in data.get('gestures', []):
-            self.insert_gesture(
-                name=gesture['name'],
-                description=gesture.get('description'),
-                category=gesture.get('category'),
-                difficulty=gesture.get('difficulty', 'beginner')
-            )
+        gestures = data.get('gestures', [])
+        sequences = data.get('sequences', [])
         
-        # Import sequences
-        for sequence in data.get('sequences', []):
-            self.insert_training_sequence(
-                gesture_name=sequence['gesture_name'],
-                sequence_data=sequence['sequence_data'],
-                frame_count=sequence.get('frame_count')
-            )
+        # One executemany per table inside one transaction: a single fsync
+        # for the whole import instead of a commit per row, with the insert
+        # trigger keeping sample counts correct along the way
+        with self.conn:
+            if gestures:
+                self.conn.executemany(_UPSERT_GESTURE_SQL, [
+                    (g['name'], g.get('description'), g.get('category'),
+                     g.get('difficulty', 'beginner'))
+                    for g in gestures
+                ])
+            if sequences:
+                self.conn.executemany(_INSERT_SEQUENCE_SQL, [
+                    (seq['gesture_name'],
+                     sqlite3.Binary(np.asarray(seq['sequence_data'],
+                                               dtype=np.float32).tobytes()),
+                     seq['frame_count'] if seq.get('frame_count') is not None
+                     else len(seq['sequence_data']))
+                    for seq in sequences
+                ])
         
-        logger.info(f"Imported data from {input_file}")
+        logger.info(f"Imported {len(gestures)} gestures and "
+                    f"{len(sequences)} sequences from {input_file}")
     
     def close(self):
-        """Close database connection."""
+        """Close database connections."""
         if self.conn:
+            self.flush_inference_logs()
             self.conn.close()
-            logger.info("Database connection closed")
+            self.conn = None
+            while not self._readers.empty():
+                self._readers.get_nowait().close()
+            logger.info("Database connections closed")
 
 
 def initialize_default_gestures():
@@ -318,8 +471,8 @@ def initialize_default_gestures():
         {'name': 'GO', 'description': 'Both hands point forward', 'category': 'commands', 'difficulty': 'beginner'},
     ]
     
-    for gesture in default_gestures:
-        db.insert_gesture(**gesture)
+    # One transaction (and one fsync) for the whole set
+    db.insert_gestures_bulk(default_gestures)
     
     stats = db.get_gesture_statistics()
     logger.info(f"Database initialized with {stats['total_gestures']} gestures")
@@ -8,7 +8,73 @@ import websockets
 import json
 import time
 import numpy as np
-from typing import List, Dict
+
+# orjson serializes the float-heavy landmark frames several times faster
+# than stdlib json; fall back silently when it is not installed
+try:
+    import orjson
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def json_dumps(obj) -> str:
+        return json.dumps(obj)
+
+    def json_loads(data):
+        return json.loads(data)
+
+def _build_shape_offsets():
+    """
+    Build the per-shape landmark offset tables once: wrist at the origin
+    plus four points per finger (21 landmarks total), as (21, 3) float32.
+    """
+    finger_specs = {
+        "open": [
+            [(0, 0), (0, -0.05), (0, -0.1), (0, -0.15), (0, -0.2)],  # Thumb
+            [(-0.05, -0.05), (-0.05, -0.1), (-0.05, -0.15), (-0.05, -0.2), (-0.05, -0.25)],  # Index
+            [(0, -0.05), (0, -0.1), (0, -0.15), (0, -0.2), (0, -0.25)],  # Middle
+            [(0.05, -0.05), (0.05, -0.1), (0.05, -0.15), (0.05, -0.2), (0.05, -0.25)],  # Ring
+            [(0.1, -0.05), (0.1, -0.1), (0.1, -0.15), (0.1, -0.2), (0.1, -0.25)]  # Pinky
+        ],
+        "fist": [
+            [(0, 0), (0, -0.02), (0, -0.03), (0, -0.04), (0, -0.05)],  # Thumb
+            [(-0.05, 0), (-0.05, -0.02), (-0.05, -0.03), (-0.05, -0.04), (-0.05, -0.05)],  # Index
+            [(0, 0), (0, -0.02), (0, -0.03), (0, -0.04), (0, -0.05)],  # Middle
+            [(0.05, 0), (0.05, -0.02), (0.05, -0.03), (0.05, -0.04), (0.05, -0.05)],  # Ring
+            [(0.1, 0), (0.1, -0.02), (0.1, -0.03), (0.1, -0.04), (0.1, -0.05)]  # Pinky
+        ],
+        "pointing": [
+            [(0, 0), (0, -0.02), (0, -0.03), (0, -0.04), (0, -0.05)],  # Thumb
+            [(-0.05, -0.05), (-0.05, -0.1), (-0.05, -0.15), (-0.05, -0.2), (-0.05, -0.25)],  # Index extended
+            [(0, 0), (0, -0.02), (0, -0.03), (0, -0.04), (0, -0.05)],  # Middle
+            [(0.05, 0), (0.05, -0.02), (0.05, -0.03), (0.05, -0.04), (0.05, -0.05)],  # Ring
+            [(0.1, 0), (0.1, -0.02), (0.1, -0.03), (0.1, -0.04), (0.1, -0.05)]  # Pinky
+        ],
+        "i_love_you": [
+            [(0, 0), (0, -0.05), (0, -0.1), (0, -0.15), (0, -0.2)],  # Thumb extended
+            [(-0.05, -0.05), (-0.05, -0.1), (-0.05, -0.15), (-0.05, -0.2), (-0.05, -0.25)],  # Index extended
+            [(0, 0), (0, -0.02), (0, -0.03), (0, -0.04), (0, -0.05)],  # Middle closed
+            [(0.05, 0), (0.05, -0.02), (0.05, -0.03), (0.05, -0.04), (0.05, -0.05)],  # Ring closed
+            [(0.1, -0.05), (0.1, -0.1), (0.1, -0.15), (0.1, -0.2), (0.1, -0.25)]  # Pinky extended
+        ],
+    }
+    
+    tables = {}
+    for shape, fingers in finger_specs.items():
+        # Wrist first, then each finger's points beyond the base (as before)
+        offsets = [(0.0, 0.0)]
+        for finger in fingers:
+            offsets.extend(finger[1:])
+        arr = np.zeros((21, 3), dtype=np.float32)
+        arr[:, :2] = np.asarray(offsets[:21], dtype=np.float32)
+        tables[shape] = arr
+    return tables
+
+# Precomputed once: generate_hand_landmarks is one vector add per call
+_SHAPE_OFFSETS = _build_shape_offsets()
 
 class SignLanguageDemo:
     """Generate realistic sign language patterns for demonstration"""
@@ -27,227 +93,133 @@ class SignLanguageDemo:
             "WATER": self.generate_water_pattern,
         }
         
-    def generate_hand_landmarks(self, shape="open", position=(0.5, 0.5)):
-        """Generate 21 hand landmarks based on shape"""
-        landmarks = []
-        base_x, base_y = position
-        
-        if shape == "open":
-            # Open hand - all fingers extended
-            finger_positions = [
-                [(0, 0), (0, -0.05), (0, -0.1), (0, -0.15), (0, -0.2)],  # Thumb
-                [(-0.05, -0.05), (-0.05, -0.1), (-0.05, -0.15), (-0.05, -0.2), (-0.05, -0.25)],  # Index
-                [(0, -0.05), (0, -0.1), (0, -0.15), (0, -0.2), (0, -0.25)],  # Middle
-                [(0.05, -0.05), (0.05, -0.1), (0.05, -0.15), (0.05, -0.2), (0.05, -0.25)],  # Ring
-                [(0.1, -0.05), (0.1, -0.1), (0.1, -0.15), (0.1, -0.2), (0.1, -0.25)]  # Pinky
-            ]
-        elif shape == "fist":
-            # Closed fist
-            finger_positions = [
-                [(0, 0), (0, -0.02), (0, -0.03), (0, -0.04), (0, -0.05)],  # Thumb
-                [(-0.05, 0), (-0.05, -0.02), (-0.05, -0.03), (-0.05, -0.04), (-0.05, -0.05)],  # Index
-                [(0, 0), (0, -0.02), (0, -0.03), (0, -0.04), (0, -0.05)],  # Middle
-                [(0.05, 0), (0.05, -0.02), (0.05, -0.03), (0.05, -0.04), (0.05, -0.05)],  # Ring
-                [(0.1, 0), (0.1, -0.02), (0.1, -0.03), (0.1, -0.04), (0.1, -0.05)]  # Pinky
-            ]
-        elif shape == "pointing":
-            # Index finger pointing
-            finger_positions = [
-                [(0, 0), (0, -0.02), (0, -0.03), (0, -0.04), (0, -0.05)],  # Thumb
-                [(-0.05, -0.05), (-0.05, -0.1), (-0.05, -0.15), (-0.05, -0.2), (-0.05, -0.25)],  # Index extended
-                [(0, 0), (0, -0.02), (0, -0.03), (0, -0.04), (0, -0.05)],  # Middle
-                [(0.05, 0), (0.05, -0.02), (0.05, -0.03), (0.05, -0.04), (0.05, -0.05)],  # Ring
-                [(0.1, 0), (0.1, -0.02), (0.1, -0.03), (0.1, -0.04), (0.1, -0.05)]  # Pinky
-            ]
-        elif shape == "i_love_you":
-            # I love you sign - thumb, index, pinky extended
-            finger_positions = [
-                [(0, 0), (0, -0.05), (0, -0.1), (0, -0.15), (0, -0.2)],  # Thumb extended
-                [(-0.05, -0.05), (-0.05, -0.1), (-0.05, -0.15), (-0.05, -0.2), (-0.05, -0.25)],  # Index extended
-                [(0, 0), (0, -0.02), (0, -0.03), (0, -0.04), (0, -0.05)],  # Middle closed
-                [(0.05, 0), (0.05, -0.02), (0.05, -0.03), (0.05, -0.04), (0.05, -0.05)],  # Ring closed
-                [(0.1, -0.05), (0.1, -0.1), (0.1, -0.15), (0.1, -0.2), (0.1, -0.25)]  # Pinky extended
-            ]
-        else:
-            # Default open hand
-            finger_positions = [
-                [(0, 0), (0, -0.05), (0, -0.1), (0, -0.15), (0, -0.2)],  # Thumb
-                [(-0.05, -0.05), (-0.05, -0.1), (-0.05, -0.15), (-0.05, -0.2), (-0.05, -0.25)],  # Index
-                [(0, -0.05), (0, -0.1), (0, -0.15), (0, -0.2), (0, -0.25)],  # Middle
-                [(0.05, -0.05), (0.05, -0.1), (0.05, -0.15), (0.05, -0.2), (0.05, -0.25)],  # Ring
-                [(0.1, -0.05), (0.1, -0.1), (0.1, -0.15), (0.1, -0.2), (0.1, -0.25)]  # Pinky
-            ]
-        
-        # Wrist position
-        landmarks.append({"x": base_x, "y": base_y, "z": 0})
-        
-        # Add finger landmarks
-        for finger in finger_positions:
-            for dx, dy in finger[1:]:  # Skip base, it's included in wrist
-                landmarks.append({
-                    "x": base_x + dx,
-                    "y": base_y + dy,
-                    "z": 0
-                })
+        # Patterns are deterministic, so generate each exactly once up
+        # front; replaying a sign in send_sign is then pure I/O
+        self._patterns = {name: generator() for name, generator in self.signs.items()}
         
-        return landmarks[:21]  # Ensure exactly 21 landmarks
+    def generate_hand_landmarks(self, shape="open", position=(0.5, 0.5)):
+        """Generate 21 hand landmarks for a shape as a (21, 3) float32 array"""
+        base = np.array([position[0], position[1], 0.0], dtype=np.float32)
+        return _SHAPE_OFFSETS.get(shape, _SHAPE_OFFSETS["open"]) + base
+    
+    def _pattern(self, shape, x, y, frames):
+        """
+        Broadcast per-frame base positions against a shape table in one op,
+        yielding the whole (frames, 21, 3) trajectory tensor.
+
+        x and y may be scalars or arrays of length frames.
+        """
+        bases = np.zeros((frames, 3), dtype=np.float32)
+        bases[:, 0] = x
+        bases[:, 1] = y
+        return _SHAPE_OFFSETS.get(shape, _SHAPE_OFFSETS["open"])[None, :, :] + bases[:, None, :]
     
     def generate_hello_pattern(self, frames=30):
         """Generate HELLO sign - waving motion"""
-        pattern = []
-        for i in range(frames):
-            # Wave motion - hand moves side to side
-            t = i / frames
-            x_offset = 0.5 + 0.2 * np.sin(t * 2 * np.pi)
-            
-            landmarks = self.generate_hand_landmarks("open", (x_offset, 0.4))
-            pattern.append(landmarks)
-        
-        return pattern
+        t = np.arange(frames, dtype=np.float32) / frames
+        # Wave motion - hand moves side to side
+        return self._pattern("open", 0.5 + 0.2 * np.sin(t * 2 * np.pi), 0.4, frames)
     
     def generate_thank_you_pattern(self, frames=20):
         """Generate THANK YOU sign - hand from chin forward"""
-        pattern = []
-        for i in range(frames):
-            t = i / frames
-            # Start at chin, move forward
-            y_pos = 0.3 + t * 0.2  # Move forward
-            
-            landmarks = self.generate_hand_landmarks("open", (0.5, y_pos))
-            pattern.append(landmarks)
-        
-        return pattern
+        t = np.arange(frames, dtype=np.float32) / frames
+        # Start at chin, move forward
+        return self._pattern("open", 0.5, 0.3 + t * 0.2, frames)
     
     def generate_yes_pattern(self, frames=20):
         """Generate YES sign - fist nodding"""
-        pattern = []
-        for i in range(frames):
-            t = i / frames
-            # Nodding motion
-            y_offset = 0.4 + 0.1 * np.sin(t * 2 * np.pi)
-            
-            landmarks = self.generate_hand_landmarks("fist", (0.5, y_offset))
-            pattern.append(landmarks)
-        
-        return pattern
+        t = np.arange(frames, dtype=np.float32) / frames
+        # Nodding motion
+        return self._pattern("fist", 0.5, 0.4 + 0.1 * np.sin(t * 2 * np.pi), frames)
     
     def generate_no_pattern(self, frames=15):
         """Generate NO sign - two fingers closing on thumb"""
-        pattern = []
-        for i in range(frames):
-            t = i / frames
-            # Fingers close together
-            shape = "open" if t < 0.5 else "fist"
-            
-            landmarks = self.generate_hand_landmarks(shape, (0.5, 0.4))
-            pattern.append(landmarks)
-        
-        return pattern
+        # Open for the first half, closed for the second
+        open_frames = sum(1 for i in range(frames) if i / frames < 0.5)
+        return np.concatenate([
+            self._pattern("open", 0.5, 0.4, open_frames),
+            self._pattern("fist", 0.5, 0.4, frames - open_frames)
+        ])
     
     def generate_help_pattern(self, frames=20):
         """Generate HELP sign - fist on flat palm, lifting"""
-        pattern = []
-        for i in range(frames):
-            t = i / frames
-            # Lift motion
-            y_pos = 0.5 - t * 0.1  # Move up
-            
-            landmarks = self.generate_hand_landmarks("fist", (0.5, y_pos))
-            pattern.append(landmarks)
-        
-        return pattern
+        t = np.arange(frames, dtype=np.float32) / frames
+        # Lift motion
+        return self._pattern("fist", 0.5, 0.5 - t * 0.1, frames)
     
     def generate_i_love_you_pattern(self, frames=10):
         """Generate I LOVE YOU sign - static sign"""
-        pattern = []
-        for i in range(frames):
-            landmarks = self.generate_hand_landmarks("i_love_you", (0.5, 0.4))
-            pattern.append(landmarks)
-        
-        return pattern
+        return self._pattern("i_love_you", 0.5, 0.4, frames)
     
     def generate_please_pattern(self, frames=30):
         """Generate PLEASE sign - circular motion on chest"""
-        pattern = []
-        for i in range(frames):
-            t = i / frames
-            # Circular motion
-            angle = t * 2 * np.pi
-            x_pos = 0.5 + 0.1 * np.cos(angle)
-            y_pos = 0.6 + 0.1 * np.sin(angle)
-            
-            landmarks = self.generate_hand_landmarks("open", (x_pos, y_pos))
-            pattern.append(landmarks)
-        
-        return pattern
+        angle = np.arange(frames, dtype=np.float32) / frames * 2 * np.pi
+        return self._pattern("open",
+                             0.5 + 0.1 * np.cos(angle),
+                             0.6 + 0.1 * np.sin(angle),
+                             frames)
     
     def generate_sorry_pattern(self, frames=30):
         """Generate SORRY sign - fist circles on chest"""
-        pattern = []
-        for i in range(frames):
-            t = i / frames
-            # Circular motion
-            angle = t * 2 * np.pi
-            x_pos = 0.5 + 0.08 * np.cos(angle)
-            y_pos = 0.6 + 0.08 * np.sin(angle)
-            
-            landmarks = self.generate_hand_landmarks("fist", (x_pos, y_pos))
-            pattern.append(landmarks)
-        
-        return pattern
+        angle = np.arange(frames, dtype=np.float32) / frames * 2 * np.pi
+        return self._pattern("fist",
+                             0.5 + 0.08 * np.cos(angle),
+                             0.6 + 0.08 * np.sin(angle),
+                             frames)
     
     def generate_hungry_pattern(self, frames=20):
         """Generate HUNGRY sign - C hand down chest"""
-        pattern = []
-        for i in range(frames):
-            t = i / frames
-            # Move down chest
-            y_pos = 0.4 + t * 0.2
-            
-            landmarks = self.generate_hand_landmarks("open", (0.5, y_pos))
-            pattern.append(landmarks)
-        
-        return pattern
+        t = np.arange(frames, dtype=np.float32) / frames
+        # Move down chest
+        return self._pattern("open", 0.5, 0.4 + t * 0.2, frames)
     
     def generate_water_pattern(self, frames=15):
         """Generate WATER sign - W taps chin"""
-        pattern = []
-        for i in range(frames):
-            t = i / frames
-            # Tapping motion
-            y_offset = 0.3 if (i % 5) < 3 else 0.28
-            
-            landmarks = self.generate_hand_landmarks("open", (0.5, y_offset))
-            pattern.append(landmarks)
-        
-        return pattern
+        # Tapping motion
+        y = np.where(np.arange(frames) % 5 < 3, 0.3, 0.28).astype(np.float32)
+        return self._pattern("open", 0.5, y, frames)
     
     async def send_sign(self, websocket, sign_name: str):
         """Send a complete sign to the WebSocket"""
-        if sign_name not in self.signs:
+        if sign_name not in self._patterns:
             print(f"Sign {sign_name} not found")
             return
         
         print(f"\n🤟 Performing sign: {sign_name}")
         
-        # Generate pattern
-        pattern = self.signs[sign_name]()
+        # Patterns are precomputed at startup
+        pattern = self._patterns[sign_name]
         
-        # Send each frame
-        for i, landmarks in enumerate(pattern):
-            message = {
+        # Pre-serialize every frame so the send loop below is pure I/O
+        # (dict conversion happens only here, at the wire)
+        payloads = []
+        for landmarks in pattern:
+            frame_landmarks = [
+                {"x": float(x), "y": float(y), "z": float(z)}
+                for x, y, z in landmarks.tolist()
+            ]
+            payloads.append(json_dumps({
                 "type": "holistic",
                 "data": {
-                    "rightHandLandmarks": landmarks,
+                    "rightHandLandmarks": frame_landmarks,
                     "leftHandLandmarks": None,
                     "poseLandmarks": None,
                     "faceLandmarks": None
                 },
                 "timestamp": time.time()
-            }
-            
-            await websocket.send(json.dumps(message))
-            await asyncio.sleep(0.033)  # ~30 FPS
+            }))
+        
+        # Pace against absolute deadlines (~30 FPS): a slow send borrows
+        # from its own sleep instead of pushing every later frame back
+        frame_interval = 0.033
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        
+        for i, payload in enumerate(payloads):
+            await websocket.send(payload)
+            delay = start + (i + 1) * frame_interval - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
         
         # Wait for recognition
         await asyncio.sleep(0.5)
@@ -269,7 +241,7 @@ class SignLanguageDemo:
                     try:
                         while True:
                             message = await websocket.recv()
-                            data = json.loads(message)
+                            data = json_loads(message)
                             
                             if data.get("type") == "prediction":
                                 sign = data.get("sign", "")
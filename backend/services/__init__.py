@@ -1,6 +1,6 @@
 """Services package for preprocessing, inference, and text-to-sign mapping."""
 from .preprocess import normalize_landmarks, normalize_hands, flatten_landmarks, flatten_hands
-from .inference import InferenceService, get_inference_service
+from .inference import InferenceService, InferenceBatcher, get_inference_service, get_inference_batcher
 from .text2sign import text_to_sign, text_to_signs, get_available_signs
 
 __all__ = [
@@ -9,7 +9,9 @@ __all__ = [
     'flatten_landmarks',
     'flatten_hands',
     'InferenceService',
+    'InferenceBatcher',
     'get_inference_service',
+    'get_inference_batcher',
     'text_to_sign',
     'text_to_signs',
     'get_available_signs'
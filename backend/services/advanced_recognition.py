@@ -2,6 +2,7 @@
 Advanced ASL Recognition Service with proper gesture patterns and filtering
 """
 
+import math
 import numpy as np
 import json
 from typing import Dict, List, Tuple, Optional
@@ -236,7 +237,8 @@ class AdvancedASLRecognizer:
         for p1, p2 in zip(hand1, hand2):
             dx = p1.get("x", 0) - p2.get("x", 0)
             dy = p1.get("y", 0) - p2.get("y", 0)
-            total_distance += np.sqrt(dx*dx + dy*dy)
+            # math.hypot: C-level scalar distance, no NumPy ufunc dispatch
+            total_distance += math.hypot(dx, dy)
             
         return total_distance / len(hand1)
     
@@ -2,6 +2,7 @@
 Comprehensive American Sign Language (ASL) Dictionary
 Includes common conversational signs and emergency phrases
 """
+import math
 from typing import Dict, List, Optional, Tuple
 import numpy as np
 from dataclasses import dataclass
@@ -636,7 +637,7 @@ class ASLRecognizer:
             if i < len(first_frame) and i < len(last_frame):
                 dx = last_frame[i]["x"] - first_frame[i]["x"]
                 dy = last_frame[i]["y"] - first_frame[i]["y"]
-                total_displacement += (dx**2 + dy**2) ** 0.5
+                total_displacement += math.hypot(dx, dy)
                 
         avg_displacement = total_displacement / min(len(first_frame), len(last_frame))
         
@@ -682,7 +683,7 @@ class ASLRecognizer:
                 for j in range(min(len(sequence[i]), len(sequence[i-1]))):
                     dx = sequence[i][j]["x"] - sequence[i-1][j]["x"]
                     dy = sequence[i][j]["y"] - sequence[i-1][j]["y"]
-                    frame_speed += (dx**2 + dy**2) ** 0.5
+                    frame_speed += math.hypot(dx, dy)
                     
                 total_speed += frame_speed
                 count += 1
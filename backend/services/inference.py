@@ -1,16 +1,18 @@
 """
 Inference Service - Predict sign and confidence from landmarks
 """
+import asyncio
 import logging
 import sys
 import os
+import numpy as np
 from typing import List, Dict, Tuple, Optional
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from model.lstm_model import SignLanguageModel
-from services.preprocess import normalize_hands, flatten_hands
+from services.preprocess import normalize_hands
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +28,14 @@ class InferenceService:
         """
         self.model = model
         self.is_loaded = model is not None
+        # INT8 TFLite interpreter, preferred over the Keras model when its
+        # companion file exists (see _load_tflite_companion)
+        self._interpreter = None
+        self._input_index = None
+        self._output_index = None
+        # predict is rebound to the matching implementation whenever the
+        # loaded state changes, so callers pay no per-call state branching
+        self.predict = self._ml_predict if self.is_loaded else self._unloaded_predict
     
     def load_model(self, model_path: str) -> bool:
         """
@@ -41,14 +51,67 @@ class InferenceService:
             self.model = SignLanguageModel()
             self.model.load_model(model_path)
             self.is_loaded = True
+            self.predict = self._ml_predict
             logger.info(f"✅ Inference model loaded from {model_path}")
+            
+            # Serve from the INT8 TFLite companion when training exported one
+            self._load_tflite_companion(model_path)
             return True
         except Exception as e:
             logger.error(f"❌ Error loading inference model: {e}")
             self.is_loaded = False
+            self.predict = self._unloaded_predict
             return False
     
-    def predict(self, landmarks: List[List[Dict[str, float]]]) -> Tuple[str, float]:
+    def _load_tflite_companion(self, model_path: str):
+        """
+        Load the quantized .tflite exported next to the Keras model, if any.
+
+        The int8 interpreter serves the same classes with lower
+        per-prediction latency; preprocessing and class names still come
+        from the loaded SignLanguageModel. Falls back silently to the
+        float32 Keras model when the companion is missing or unloadable.
+        """
+        self._interpreter = None
+        tflite_path = os.path.splitext(model_path)[0] + '.tflite'
+        if not os.path.exists(tflite_path):
+            return
+        
+        try:
+            import tensorflow as tf
+            interpreter = tf.lite.Interpreter(model_path=tflite_path)
+            interpreter.allocate_tensors()
+            self._input_index = interpreter.get_input_details()[0]['index']
+            self._output_index = interpreter.get_output_details()[0]['index']
+            self._interpreter = interpreter
+            logger.info(f"✅ Serving predictions from INT8 TFLite model: {tflite_path}")
+        except Exception as e:
+            logger.warning(f"TFLite companion failed to load ({e}); "
+                           "falling back to the Keras model")
+            self._interpreter = None
+    
+    def _tflite_predict(self, landmarks: List[List[Dict[str, float]]]) -> Tuple[str, float]:
+        """Forward pass through the INT8 TFLite interpreter."""
+        sequence = self.model.prepare_sequence(landmarks)
+        sequence = np.expand_dims(sequence, axis=0).astype(np.float32)
+        
+        self._interpreter.set_tensor(self._input_index, sequence)
+        self._interpreter.invoke()
+        predictions = self._interpreter.get_tensor(self._output_index)[0]
+        
+        predicted_idx = int(np.argmax(predictions))
+        confidence = float(predictions[predicted_idx])
+        
+        class_names = self.model.class_names
+        if class_names and predicted_idx < len(class_names):
+            return class_names[predicted_idx], confidence
+        return f"Class_{predicted_idx}", confidence
+    
+    def _unloaded_predict(self, landmarks: List[List[Dict[str, float]]]) -> Tuple[str, float]:
+        """predict() implementation bound while no model is loaded."""
+        raise ValueError("Model not loaded. Call load_model() first.")
+    
+    def _ml_predict(self, landmarks: List[List[Dict[str, float]]]) -> Tuple[str, float]:
         """
         Predict gesture from hand landmarks.
         
@@ -58,9 +121,6 @@ class InferenceService:
         Returns:
             Tuple of (predicted_word, confidence_score)
         """
-        if not self.is_loaded or self.model is None:
-            raise ValueError("Model not loaded. Call load_model() first.")
-        
         try:
             # Normalize landmarks
             normalized_hands = normalize_hands(landmarks)
@@ -68,7 +128,11 @@ class InferenceService:
             if not normalized_hands:
                 return "Unknown", 0.0
             
-            # Predict using model
+            # Predict using the quantized interpreter when available,
+            # otherwise the float32 Keras model
+            if self._interpreter is not None:
+                return self._tflite_predict(normalized_hands)
+            
             predicted_word, confidence = self.model.predict(normalized_hands)
             
             return predicted_word, confidence
@@ -89,8 +153,76 @@ class InferenceService:
         """
         return [self.predict(landmarks) for landmarks in landmarks_batch]
 
+class InferenceBatcher:
+    """
+    Microbatches predict() calls from all active WebSocket connections.
+
+    Per-call fixed overhead (tensor conversion, kernel launch) dominates at
+    batch size 1, so requests arriving within a short window are collected
+    and served by a single predict_batch() call, with results fanned back
+    to each caller's future.
+    """
+
+    def __init__(self, service: 'InferenceService',
+                 max_batch: int = 16, max_wait_ms: float = 8.0):
+        """
+        Initialize the batcher.
+
+        Args:
+            service: Inference service to run the batched predictions
+            max_batch: Flush as soon as this many requests are pending
+            max_wait_ms: Flush at most this long after the first request
+        """
+        self.service = service
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self._pending: List[Tuple[List, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    async def submit(self, landmarks: List[List[Dict[str, float]]]) -> Tuple[str, float]:
+        """
+        Queue one prediction request and await its result.
+
+        Args:
+            landmarks: List of hand landmark lists (one request)
+
+        Returns:
+            Tuple of (predicted_word, confidence_score)
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((landmarks, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _flush(self):
+        """Run one batched prediction and resolve the pending futures."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        try:
+            results = self.service.predict_batch([landmarks for landmarks, _ in pending])
+        except Exception as e:
+            logger.error(f"Batched inference failed: {e}")
+            results = [("Unknown", 0.0)] * len(pending)
+
+        for (_, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
+
 # Global inference service instance
 _inference_service: Optional[InferenceService] = None
+_inference_batcher: Optional[InferenceBatcher] = None
 
 def get_inference_service() -> InferenceService:
     """Get the global inference service instance."""
@@ -99,3 +231,10 @@ def get_inference_service() -> InferenceService:
         _inference_service = InferenceService()
     return _inference_service
 
+def get_inference_batcher() -> InferenceBatcher:
+    """Get the global inference batcher over the shared service."""
+    global _inference_batcher
+    if _inference_batcher is None:
+        _inference_batcher = InferenceBatcher(get_inference_service())
+    return _inference_batcher
+
@@ -2,7 +2,7 @@
 Preprocessing Service - Landmark normalization and feature extraction
 """
 import numpy as np
-from typing import List, Dict, Tuple
+from typing import List, Dict
 
 def normalize_landmarks(landmarks: List[Dict[str, float]]) -> List[Dict[str, float]]:
     """
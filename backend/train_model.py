@@ -80,8 +80,10 @@ def load_training_data(data_dir: str = 'training_data') -> Tuple[np.ndarray, np.
         
         gesture_idx = class_names.index(gesture_name)
         
-        # Load all sequences for this gesture
-        sequence_files = [f for f in os.listdir(gesture_path) if f.endswith('.json')]
+        # Load all sequences for this gesture (.npz from the collector,
+        # .json for legacy data)
+        sequence_files = [f for f in os.listdir(gesture_path)
+                          if f.endswith(('.json', '.npz'))]
         
         logger.info(f"Loading {len(sequence_files)} sequences for gesture: {gesture_name}")
         
@@ -89,12 +91,16 @@ def load_training_data(data_dir: str = 'training_data') -> Tuple[np.ndarray, np.
             seq_path = os.path.join(gesture_path, seq_file)
             
             try:
-                with open(seq_path, 'r') as f:
-                    sequence_data = json.load(f)
-                
-                # Process sequence
-                model = SignLanguageModel()
-                features = model.prepare_sequence(sequence_data)
+                if seq_file.endswith('.npz'):
+                    # Binary float16 sample: decode straight to features
+                    features = np.load(seq_path)["seq"].astype(np.float32)
+                else:
+                    with open(seq_path, 'r') as f:
+                        sequence_data = json.load(f)
+                    
+                    # Process sequence
+                    model = SignLanguageModel()
+                    features = model.prepare_sequence(sequence_data)
                 
                 X.append(features)
                 y.append(gesture_name)
@@ -163,6 +169,46 @@ def prepare_labels(y: np.ndarray, class_names: List[str]) -> np.ndarray:
     
     return y_encoded
 
+def export_quantized_model(keras_model, representative_data: np.ndarray,
+                           tflite_path: str) -> bool:
+    """
+    Export an INT8 post-training-quantized TFLite model.
+
+    Landmark classifiers tolerate PTQ well, and int8 kernels cut both
+    latency and model size for the realtime WebSocket path. Inputs and
+    outputs stay float32 so callers need no quantize/dequantize changes.
+
+    Args:
+        keras_model: Trained Keras model to convert
+        representative_data: Training sequences used for calibration
+        tflite_path: Where to write the .tflite file
+
+    Returns:
+        True if the export succeeded, False otherwise
+    """
+    def representative_dataset():
+        for i in range(min(len(representative_data), 100)):
+            yield [representative_data[i:i + 1].astype(np.float32)]
+
+    try:
+        converter = tf.lite.TFLiteConverter.from_keras_model(keras_model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.float32
+        converter.inference_output_type = tf.float32
+        tflite_model = converter.convert()
+    except Exception as e:
+        logger.error(f"INT8 TFLite export failed: {e}")
+        return False
+
+    with open(tflite_path, 'wb') as f:
+        f.write(tflite_model)
+
+    logger.info(f"INT8 TFLite model saved to: {tflite_path} "
+                f"({len(tflite_model) / 1024:.0f} KB)")
+    return True
+
 def train_sign_language_model(
     data_dir: str = 'training_data',
     model_save_path: str = 'models/sign_language_model.h5',
@@ -231,6 +277,10 @@ def train_sign_language_model(
     os.makedirs(os.path.dirname(model_save_path), exist_ok=True)
     model.save_model(model_save_path)
     
+    # Export an INT8-quantized TFLite companion for low-latency inference
+    tflite_path = os.path.splitext(model_save_path)[0] + '.tflite'
+    export_quantized_model(model.model, X_train, tflite_path)
+    
     logger.info("=" * 60)
     logger.info("Training completed successfully!")
     logger.info(f"Model saved to: {model_save_path}")
@@ -4,12 +4,10 @@ Handles real-time sign language detection and translation
 """
 
 from typing import List, Dict, Any, Optional
-from fastapi import WebSocket, WebSocketDisconnect
+from fastapi import WebSocket
 import json
 import logging
-import asyncio
 import time
-import numpy as np
 import os
 from collections import deque
 
@@ -17,8 +15,7 @@ from collections import deque
 from model import SignLanguageModel
 from database_setup import SignDatabase
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+# Setup logging (configured once by the entrypoint)
 logger = logging.getLogger(__name__)
 
 
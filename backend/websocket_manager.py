@@ -1,10 +1,9 @@
 from typing import List, Dict, Any
-from fastapi import WebSocket, WebSocketDisconnect
+from fastapi import WebSocket
 import json
 import logging
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+# Setup logging (configured once by the entrypoint)
 logger = logging.getLogger(__name__)
 
 class WebSocketManager:
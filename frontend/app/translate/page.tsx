@@ -69,7 +69,7 @@ export default function TranslatePage() {
   // Custom hooks
   const {
     sendMessage,
-    lastMessage,
+    messageBatch,
     connectionStatus,
     isConnected
   } = useWebSocketStable(WEBSOCKET_URL, {
@@ -102,11 +102,12 @@ export default function TranslatePage() {
     requestAllPermissions
   } = useMediaPermissions()
 
-  // Process incoming WebSocket messages with improved filtering
+  // Process incoming WebSocket messages with improved filtering.
+  // Batched frames arrive as an array so no prediction is dropped.
   useEffect(() => {
-    if (lastMessage) {
+    for (const rawMessage of messageBatch) {
       try {
-        const data = JSON.parse(lastMessage)
+        const data = JSON.parse(rawMessage)
 
         if (data.type === 'prediction') {
           const currentTime = Date.now()
@@ -116,15 +117,13 @@ export default function TranslatePage() {
 
           // Filter out low confidence and "Unknown" predictions
           if (data.sign && data.sign !== 'Unknown' && data.confidence > confidenceThreshold) {
-            // Buffer the sign to ensure consistency
-            if (signBuffer.sign === data.sign) {
-              setSignBuffer(prev => ({ ...prev, count: prev.count + 1 }))
-            } else {
-              setSignBuffer({ sign: data.sign, count: 1 })
-            }
-            
-            // Only accept sign if it appears consistently (at least 3 times)
-            if (signBuffer.count >= 3) {
+            // Functional update that keeps the previous object identity
+            // when nothing changed, so re-runs of this effect converge
+            setSignBuffer(prev => prev.sign === data.sign ? prev : { sign: data.sign, count: 1 })
+
+            // The server suppresses repeated identical predictions, so each
+            // arrival is already a debounced, confident sign - accept it
+            if (data.sign) {
               // Check if this is a new sign (not the same as last spoken)
               // or if enough time has passed (3 seconds) to repeat the same sign
               const isNewSign = data.sign !== lastSpokenSign
@@ -187,12 +186,12 @@ export default function TranslatePage() {
                 setLastSignTime(currentTime)
                 
                 // Reset buffer after successful recognition
-                setSignBuffer({ sign: '', count: 0 })
+                setSignBuffer(prev => prev.sign === '' ? prev : { sign: '', count: 0 })
               }
             }
           } else if (data.confidence < 0.5) {
             // Reset buffer if confidence drops too low
-            setSignBuffer({ sign: '', count: 0 })
+            setSignBuffer(prev => prev.sign === '' ? prev : { sign: '', count: 0 })
           }
         } else if (data.type === 'gesture_metadata') {
           // Handle gesture metadata for better visualization
@@ -214,7 +213,7 @@ export default function TranslatePage() {
         console.error('Error processing message:', error)
       }
     }
-  }, [lastMessage, soundEnabled, mode, signBuffer, lastSpokenSign, lastSignTime])
+  }, [messageBatch, soundEnabled, mode, lastSpokenSign, lastSignTime])
 
   // Check permissions on mount
   useEffect(() => {
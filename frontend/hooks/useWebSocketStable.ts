@@ -19,6 +19,7 @@ export function useWebSocketStable(
   } = options
 
   const [lastMessage, setLastMessage] = useState<string | null>(null)
+  const [messageBatch, setMessageBatch] = useState<string[]>([])
   const [connectionStatus, setConnectionStatus] = useState<ConnectionStatus>('disconnected')
   const wsRef = useRef<WebSocket | null>(null)
   const reconnectTimeoutRef = useRef<NodeJS.Timeout>()
@@ -87,10 +88,19 @@ export function useWebSocketStable(
       ws.onmessage = (event) => {
         try {
           const data = JSON.parse(event.data)
-          if (data.type !== 'pong') {
-            setLastMessage(event.data)
+          if (data.type === 'pong') {
+            return
           }
+          // Deliver every message of a frame as one array: setting a single
+          // lastMessage slot N times in this handler collapses under React's
+          // render batching, so consumers would only ever see the last item
+          const items = data.type === 'prediction_batch'
+            ? (data.items ?? []).map((item: unknown) => JSON.stringify(item))
+            : [event.data as string]
+          setMessageBatch(items)
+          setLastMessage(items[items.length - 1] ?? null)
         } catch {
+          setMessageBatch([event.data as string])
           setLastMessage(event.data)
         }
       }
@@ -210,6 +220,7 @@ export function useWebSocketStable(
   
   return {
     lastMessage,
+    messageBatch,
     sendMessage,
     connectionStatus,
     isConnected: connectionStatus === 'connected',